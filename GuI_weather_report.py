@@ -7,236 +7,631 @@ A comprehensive weather application with modern GUI interface
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import requests
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import matplotlib
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.patches import Wedge
 from datetime import datetime, timedelta
+import io
 import json
 import os
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import threading
 import queue
-from PIL import Image, ImageTk
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import warnings
 warnings.filterwarnings('ignore')
 
+# orjson parses and serializes much faster than the json module; fall back when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+# Delay before a search box runs its query after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows inserted at a time into the city selection list while scrolling
+TREE_PAGE_SIZE = 50
+
+# Result queue polling interval while results are arriving and while idle
+QUEUE_POLL_BUSY_MS = 50
+QUEUE_POLL_IDLE_MS = 300
+
+# Upper bound on parallel requests when comparing cities, to stay clear of
+# OpenWeatherMap's rate limiting
+MAX_COMPARISON_WORKERS = 8
+
+# Distinct search queries whose results are remembered
+SEARCH_CACHE_SIZE = 256
+
+# pandas is slow to import and only needed once a forecast arrives, so it is
+# loaded on first use by _ensure_pandas()
+pd = None
+
+def _ensure_pandas():
+    """Import pandas on first use"""
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+    return pd
+
+# Matplotlib settings equivalent to seaborn's "whitegrid" style, so the GUI
+# doesn't have to import seaborn just to style its charts
+WHITEGRID_STYLE = {
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.labelcolor': '.15',
+    'grid.color': '.8',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+}
+
+def decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def fold_text(text: str) -> str:
+    """Lowercase text and strip accents, e.g. 'São Paulo' -> 'sao paulo'"""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+
+# API timestamps are UTC epoch seconds; the app displays local time
+# Timestamp spans shorter than this can't contain two DST changes, so equal
+# offsets at both ends mean the offset is the same throughout
+DST_STABLE_SPAN = 30 * 24 * 3600
+
+def local_utc_offsets(epoch_seconds: np.ndarray) -> np.ndarray:
+    """Local UTC offset in seconds at each epoch timestamp, following DST like datetime.fromtimestamp"""
+    epoch_seconds = np.asarray(epoch_seconds, dtype=np.int64)
+    if not len(epoch_seconds):
+        return np.zeros(0, dtype=np.int64)
+    
+    # A forecast window rarely crosses a DST change, so look up the two ends
+    # and only go entry by entry when the offset changes in between
+    first, last = int(epoch_seconds.min()), int(epoch_seconds.max())
+    offset = time.localtime(first).tm_gmtoff
+    if last - first < DST_STABLE_SPAN and time.localtime(last).tm_gmtoff == offset:
+        return np.full(len(epoch_seconds), offset, dtype=np.int64)
+    return np.fromiter((time.localtime(t).tm_gmtoff for t in epoch_seconds.tolist()),
+                       np.int64, len(epoch_seconds))
+
+def to_local_datetime(epoch_seconds: "pd.Series") -> "pd.Series":
+    """Convert a series of UTC epoch seconds to naive local datetimes"""
+    _ensure_pandas()
+    epoch = epoch_seconds.to_numpy(dtype=np.int64)
+    return pd.Series(pd.to_datetime(epoch + local_utc_offsets(epoch), unit='s'), index=epoch_seconds.index)
+
+def to_local_datetime64(epoch_seconds: np.ndarray) -> np.ndarray:
+    """Convert an array of UTC epoch seconds to naive local datetime64 values"""
+    epoch_seconds = np.asarray(epoch_seconds, dtype=np.int64)
+    return (epoch_seconds + local_utc_offsets(epoch_seconds)).astype('datetime64[s]')
+
+# Title, fill colour and reading font size of each current weather gauge
+GAUGE_STYLES = (
+    ('Current Temperature', '#FF6B6B', 12),
+    ('Feels Like', '#4ECDC4', 12),
+    ('Humidity', '#45B7D1', 12),
+    ('Pressure', '#96CEB4', 10),
+)
+
+# Text report layouts, filled in with str.format_map
+CURRENT_WEATHER_TEMPLATE = """\
+╔══════════════════════════════════════════════════════════════╗
+║                     CURRENT WEATHER REPORT                   ║
+╠══════════════════════════════════════════════════════════════╣
+║ Location: {city}, {country}
+║ Last Updated: {updated}
+║
+║ TEMPERATURE INFORMATION:
+║ ├─ Current Temperature: {temp}°C
+║ ├─ Feels Like: {feels_like}°C
+║ ├─ Condition: {description}
+║
+║ ATMOSPHERIC CONDITIONS:
+║ ├─ Humidity: {humidity}%
+║ ├─ Pressure: {pressure} hPa
+║ ├─ Visibility: {visibility} km
+║
+║ WIND INFORMATION:
+║ ├─ Speed: {wind_speed} m/s
+║ ├─ Direction: {wind_deg}°
+║
+║ SUN INFORMATION:
+║ ├─ Sunrise: {sunrise}
+║ ├─ Sunset: {sunset}
+║
+╚══════════════════════════════════════════════════════════════╝"""
+
+FORECAST_HEADER_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                    5-DAY WEATHER FORECAST                    ║
+╠══════════════════════════════════════════════════════════════╣
+║ Location: {city}, {country}
+║ Generated: {generated}
+║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+
+FORECAST_DAY_TEMPLATE = """
+{date}
+============================================================
+
+Temperature Range:  {min_temp:.1f}°C - {max_temp:.1f}°C
+Condition:          {condition}
+Average Humidity:   {avg_humidity:.0f}%
+Average Pressure:   {avg_pressure:.0f} hPa
+
+Hourly Details:
+"""
+
+# Major world cities organized by continent and country. Built once at import
+# and shared read-only by every WorldCitiesDatabase instance.
+_CITIES_RAW = {
+    "North America": {
+        "United States": (
+            "New York", "Los Angeles", "Chicago", "Houston", "Phoenix", 
+            "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose",
+            "Austin", "Jacksonville", "San Francisco", "Columbus", "Charlotte",
+            "Fort Worth", "Indianapolis", "Seattle", "Denver", "Washington DC",
+            "Boston", "El Paso", "Nashville", "Detroit", "Oklahoma City",
+            "Portland", "Las Vegas", "Memphis", "Louisville", "Baltimore",
+            "Milwaukee", "Albuquerque", "Tucson", "Fresno", "Sacramento",
+            "Kansas City", "Mesa", "Atlanta", "Colorado Springs", "Omaha",
+            "Raleigh", "Miami", "Cleveland", "Tulsa", "Oakland", "Minneapolis"
+        ),
+        "Canada": (
+            "Toronto", "Montreal", "Vancouver", "Calgary", "Edmonton",
+            "Ottawa", "Winnipeg", "Quebec City", "Hamilton", "Kitchener",
+            "London", "Victoria", "Halifax", "Oshawa", "Windsor"
+        ),
+        "Mexico": (
+            "Mexico City", "Guadalajara", "Monterrey", "Puebla", "Tijuana",
+            "León", "Juárez", "Torreón", "Querétaro", "San Luis Potosí"
+        )
+    },
+    "South America": {
+        "Brazil": (
+            "São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza",
+            "Belo Horizonte", "Manaus", "Curitiba", "Recife", "Porto Alegre"
+        ),
+        "Argentina": (
+            "Buenos Aires", "Córdoba", "Rosario", "Mendoza", "Tucumán",
+            "La Plata", "Mar del Plata", "Salta", "Santa Fe", "San Juan"
+        ),
+        "Chile": (
+            "Santiago", "Valparaíso", "Concepción", "La Serena", "Antofagasta",
+            "Temuco", "Rancagua", "Talca", "Arica", "Chillán"
+        ),
+        "Colombia": (
+            "Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena",
+            "Cúcuta", "Bucaramanga", "Pereira", "Santa Marta", "Ibagué"
+        )
+    },
+    "Europe": {
+        "United Kingdom": (
+            "London", "Birmingham", "Manchester", "Glasgow", "Liverpool",
+            "Leeds", "Sheffield", "Edinburgh", "Bristol", "Cardiff"
+        ),
+        "Germany": (
+            "Berlin", "Hamburg", "Munich", "Cologne", "Frankfurt",
+            "Stuttgart", "Düsseldorf", "Dortmund", "Essen", "Leipzig"
+        ),
+        "France": (
+            "Paris", "Marseille", "Lyon", "Toulouse", "Nice",
+            "Nantes", "Strasbourg", "Montpellier", "Bordeaux", "Lille"
+        ),
+        "Italy": (
+            "Rome", "Milan", "Naples", "Turin", "Palermo",
+            "Genoa", "Bologna", "Florence", "Bari", "Catania"
+        ),
+        "Spain": (
+            "Madrid", "Barcelona", "Valencia", "Seville", "Zaragoza",
+            "Málaga", "Murcia", "Palma", "Las Palmas", "Bilbao"
+        ),
+        "Russia": (
+            "Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Nizhny Novgorod",
+            "Kazan", "Chelyabinsk", "Omsk", "Samara", "Rostov-on-Don"
+        )
+    },
+    "Asia": {
+        "China": (
+            "Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Tianjin",
+            "Wuhan", "Dongguan", "Chengdu", "Nanjing", "Chongqing"
+        ),
+        "India": (
+            "Mumbai", "Delhi", "Bangalore", "Hyderabad", "Ahmedabad",
+            "Chennai", "Kolkata", "Surat", "Pune", "Jaipur"
+        ),
+        "Japan": (
+            "Tokyo", "Yokohama", "Osaka", "Nagoya", "Sapporo",
+            "Fukuoka", "Kobe", "Kawasaki", "Kyoto", "Saitama"
+        ),
+        "South Korea": (
+            "Seoul", "Busan", "Incheon", "Daegu", "Daejeon",
+            "Gwangju", "Suwon", "Ulsan", "Changwon", "Goyang"
+        ),
+        "Thailand": (
+            "Bangkok", "Samut Prakan", "Mueang Nonthaburi", "Udon Thani", "Chon Buri",
+            "Nakhon Ratchasima", "Chiang Mai", "Hat Yai", "Pak Kret", "Si Racha"
+        )
+    },
+    "Africa": {
+        "Nigeria": (
+            "Lagos", "Kano", "Ibadan", "Kaduna", "Port Harcourt",
+            "Benin City", "Maiduguri", "Zaria", "Aba", "Jos"
+        ),
+        "Egypt": (
+            "Cairo", "Alexandria", "Giza", "Shubra El Kheima", "Port Said",
+            "Suez", "Luxor", "Mansoura", "El Mahalla El Kubra", "Tanta"
+        ),
+        "South Africa": (
+            "Cape Town", "Johannesburg", "Durban", "Pretoria", "Port Elizabeth",
+            "Pietermaritzburg", "Benoni", "Tembisa", "East London", "Vereeniging"
+        )
+    },
+    "Oceania": {
+        "Australia": (
+            "Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide",
+            "Gold Coast", "Newcastle", "Canberra", "Sunshine Coast", "Wollongong"
+        ),
+        "New Zealand": (
+            "Auckland", "Wellington", "Christchurch", "Hamilton", "Tauranga",
+            "Napier-Hastings", "Dunedin", "Palmerston North", "Nelson", "Rotorua"
+        )
+    }
+}
+
+WORLD_CITIES = MappingProxyType({
+    continent: MappingProxyType(countries) for continent, countries in _CITIES_RAW.items()
+})
+
+POPULAR_CITIES = (
+    "New York", "London", "Tokyo", "Paris", "Singapore", "Sydney", "Dubai",
+    "Hong Kong", "Los Angeles", "Barcelona", "Amsterdam", "Seoul", "Berlin",
+    "Rome", "Madrid", "Mumbai", "Bangkok", "Istanbul", "Vienna", "Prague",
+    "Buenos Aires", "São Paulo", "Mexico City", "Cairo", "Moscow", "Delhi",
+    "Shanghai", "Beijing", "Toronto", "Vancouver", "Montreal", "Chicago",
+    "San Francisco", "Miami", "Las Vegas", "Orlando", "Boston", "Washington DC"
+)
+
 class WorldCitiesDatabase:
     """Database of major world cities organized by continent and country"""
     
+    __slots__ = ('cities', '_city_rows', '_all_cities_sorted', '_all_cities_ascii', '_bigram_index',
+                 '_gram_matches', '_search_cache', '_search_ready', '_by_continent', '_continents',
+                 '_continent_counts', '_country_to_cities', '_city_locations')
+    
     def __init__(self):
-        self.cities = {
-            "North America": {
-                "United States": [
-                    "New York", "Los Angeles", "Chicago", "Houston", "Phoenix", 
-                    "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose",
-                    "Austin", "Jacksonville", "San Francisco", "Columbus", "Charlotte",
-                    "Fort Worth", "Indianapolis", "Seattle", "Denver", "Washington DC",
-                    "Boston", "El Paso", "Nashville", "Detroit", "Oklahoma City",
-                    "Portland", "Las Vegas", "Memphis", "Louisville", "Baltimore",
-                    "Milwaukee", "Albuquerque", "Tucson", "Fresno", "Sacramento",
-                    "Kansas City", "Mesa", "Atlanta", "Colorado Springs", "Omaha",
-                    "Raleigh", "Miami", "Cleveland", "Tulsa", "Oakland", "Minneapolis"
-                ],
-                "Canada": [
-                    "Toronto", "Montreal", "Vancouver", "Calgary", "Edmonton",
-                    "Ottawa", "Winnipeg", "Quebec City", "Hamilton", "Kitchener",
-                    "London", "Victoria", "Halifax", "Oshawa", "Windsor"
-                ],
-                "Mexico": [
-                    "Mexico City", "Guadalajara", "Monterrey", "Puebla", "Tijuana",
-                    "León", "Juárez", "Torreón", "Querétaro", "San Luis Potosí"
-                ]
-            },
-            "South America": {
-                "Brazil": [
-                    "São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza",
-                    "Belo Horizonte", "Manaus", "Curitiba", "Recife", "Porto Alegre"
-                ],
-                "Argentina": [
-                    "Buenos Aires", "Córdoba", "Rosario", "Mendoza", "Tucumán",
-                    "La Plata", "Mar del Plata", "Salta", "Santa Fe", "San Juan"
-                ],
-                "Chile": [
-                    "Santiago", "Valparaíso", "Concepción", "La Serena", "Antofagasta",
-                    "Temuco", "Rancagua", "Talca", "Arica", "Chillán"
-                ],
-                "Colombia": [
-                    "Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena",
-                    "Cúcuta", "Bucaramanga", "Pereira", "Santa Marta", "Ibagué"
-                ]
-            },
-            "Europe": {
-                "United Kingdom": [
-                    "London", "Birmingham", "Manchester", "Glasgow", "Liverpool",
-                    "Leeds", "Sheffield", "Edinburgh", "Bristol", "Cardiff"
-                ],
-                "Germany": [
-                    "Berlin", "Hamburg", "Munich", "Cologne", "Frankfurt",
-                    "Stuttgart", "Düsseldorf", "Dortmund", "Essen", "Leipzig"
-                ],
-                "France": [
-                    "Paris", "Marseille", "Lyon", "Toulouse", "Nice",
-                    "Nantes", "Strasbourg", "Montpellier", "Bordeaux", "Lille"
-                ],
-                "Italy": [
-                    "Rome", "Milan", "Naples", "Turin", "Palermo",
-                    "Genoa", "Bologna", "Florence", "Bari", "Catania"
-                ],
-                "Spain": [
-                    "Madrid", "Barcelona", "Valencia", "Seville", "Zaragoza",
-                    "Málaga", "Murcia", "Palma", "Las Palmas", "Bilbao"
-                ],
-                "Russia": [
-                    "Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Nizhny Novgorod",
-                    "Kazan", "Chelyabinsk", "Omsk", "Samara", "Rostov-on-Don"
-                ]
-            },
-            "Asia": {
-                "China": [
-                    "Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Tianjin",
-                    "Wuhan", "Dongguan", "Chengdu", "Nanjing", "Chongqing"
-                ],
-                "India": [
-                    "Mumbai", "Delhi", "Bangalore", "Hyderabad", "Ahmedabad",
-                    "Chennai", "Kolkata", "Surat", "Pune", "Jaipur"
-                ],
-                "Japan": [
-                    "Tokyo", "Yokohama", "Osaka", "Nagoya", "Sapporo",
-                    "Fukuoka", "Kobe", "Kawasaki", "Kyoto", "Saitama"
-                ],
-                "South Korea": [
-                    "Seoul", "Busan", "Incheon", "Daegu", "Daejeon",
-                    "Gwangju", "Suwon", "Ulsan", "Changwon", "Goyang"
-                ],
-                "Thailand": [
-                    "Bangkok", "Samut Prakan", "Mueang Nonthaburi", "Udon Thani", "Chon Buri",
-                    "Nakhon Ratchasima", "Chiang Mai", "Hat Yai", "Pak Kret", "Si Racha"
-                ]
-            },
-            "Africa": {
-                "Nigeria": [
-                    "Lagos", "Kano", "Ibadan", "Kaduna", "Port Harcourt",
-                    "Benin City", "Maiduguri", "Zaria", "Aba", "Jos"
-                ],
-                "Egypt": [
-                    "Cairo", "Alexandria", "Giza", "Shubra El Kheima", "Port Said",
-                    "Suez", "Luxor", "Mansoura", "El Mahalla El Kubra", "Tanta"
-                ],
-                "South Africa": [
-                    "Cape Town", "Johannesburg", "Durban", "Pretoria", "Port Elizabeth",
-                    "Pietermaritzburg", "Benoni", "Tembisa", "East London", "Vereeniging"
-                ]
-            },
-            "Oceania": {
-                "Australia": [
-                    "Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide",
-                    "Gold Coast", "Newcastle", "Canberra", "Sunshine Coast", "Wollongong"
-                ],
-                "New Zealand": [
-                    "Auckland", "Wellington", "Christchurch", "Hamilton", "Tauranga",
-                    "Napier-Hastings", "Dunedin", "Palmerston North", "Nelson", "Rotorua"
-                ]
-            }
+        self.cities = WORLD_CITIES
+        
+        # Precompute flat lookup structures once so searches and filters
+        # don't re-walk the nested dict on every keystroke. They are handed
+        # out as immutable tuples, so callers get the same object every time
+        self._city_rows = tuple(sorted(
+            ((city, continent, country)
+             for continent, countries in self.cities.items()
+             for country, cities in countries.items()
+             for city in cities),
+            key=lambda row: row[0]
+        ))
+        self._all_cities_sorted = tuple(row[0] for row in self._city_rows)
+        self._all_cities_ascii = [fold_text(city) for city in self._all_cities_sorted]
+        
+        self._search_cache: Dict[str, Tuple[str, ...]] = {}
+        self._by_continent = {
+            continent: tuple(sorted(city for cities in countries.values() for city in cities))
+            for continent, countries in self.cities.items()
         }
+        self._continents = tuple(self.cities.keys())
+        self._continent_counts = {continent: len(cities) for continent, cities in self._by_continent.items()}
+        self._country_to_cities = {
+            country: tuple(sorted(cities))
+            for countries in self.cities.values()
+            for country, cities in countries.items()
+        }
+        # City -> (continent, country); the first listing wins for names that
+        # appear under more than one country
+        self._city_locations: Dict[str, Tuple[str, str]] = {}
+        for continent, countries in self.cities.items():
+            for country, cities in countries.items():
+                for city in cities:
+                    self._city_locations.setdefault(city, (continent, country))
+        
+        # The search index is only needed once the user types, so build it
+        # off the UI thread while the window comes up
+        self._search_ready = threading.Event()
+        threading.Thread(target=self._build_search_index, daemon=True).start()
     
-    def get_all_cities(self) -> List[str]:
+    def _build_search_index(self):
+        """Build the gram indexes used by search_cities"""
+        # Inverted indexes of characters and character bigrams, stored as
+        # bitsets where bit i is set if the i-th sorted city contains the gram.
+        # Intersecting postings is then a single big-int AND. Only the bigram
+        # index is kept; single characters are fully answered by gram_matches
+        char_index: Dict[str, int] = {}
+        bigram_index: Dict[str, int] = {}
+        for i, folded in enumerate(self._all_cities_ascii):
+            bit = 1 << i
+            for j, char in enumerate(folded):
+                char_index[char] = char_index.get(char, 0) | bit
+                bigram = folded[j:j + 2]
+                if len(bigram) == 2:
+                    bigram_index[bigram] = bigram_index.get(bigram, 0) | bit
+        # One- and two-character postings are exact answers, so decode them up
+        # front; short queries match many cities and walking bits costs more there
+        gram_matches: Dict[str, Tuple[str, ...]] = {
+            gram: tuple(self._cities_from_bits(bits))
+            for index in (char_index, bigram_index)
+            for gram, bits in index.items()
+        }
+        
+        self._bigram_index = bigram_index
+        self._gram_matches = gram_matches
+        self._search_ready.set()
+    
+    def get_all_cities(self) -> Tuple[str, ...]:
         """Get a flat list of all cities"""
-        all_cities = []
-        for continent in self.cities.values():
-            for country in continent.values():
-                all_cities.extend(country)
-        return sorted(all_cities)
+        return self._all_cities_sorted
+    
+    def get_continents(self) -> Tuple[str, ...]:
+        """Get the names of all continents"""
+        return self._continents
     
-    def get_cities_by_continent(self, continent: str) -> List[str]:
+    def get_continent_city_count(self, continent: str) -> int:
+        """Get the number of cities in a specific continent"""
+        return self._continent_counts.get(continent, 0)
+    
+    def get_cities_by_continent(self, continent: str) -> Tuple[str, ...]:
         """Get all cities in a specific continent"""
-        if continent not in self.cities:
-            return []
-        cities = []
-        for country in self.cities[continent].values():
-            cities.extend(country)
-        return sorted(cities)
+        return self._by_continent.get(continent, ())
     
-    def get_cities_by_country(self, country: str) -> List[str]:
+    def get_cities_by_country(self, country: str) -> Tuple[str, ...]:
         """Get all cities in a specific country"""
-        for continent in self.cities.values():
-            if country in continent:
-                return sorted(continent[country])
-        return []
-    
-    def search_cities(self, query: str) -> List[str]:
-        """Search cities by partial name match"""
-        query = query.lower()
-        matching_cities = []
-        for continent in self.cities.values():
-            for country in continent.values():
-                for city in country:
-                    if query in city.lower():
-                        matching_cities.append(city)
-        return sorted(matching_cities)
-    
-    def get_popular_cities(self, limit: int = 50) -> List[str]:
+        return self._country_to_cities.get(country, ())
+    
+    def get_city_rows(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Get (city, continent, country) rows for every city, sorted by city"""
+        return self._city_rows
+    
+    def locate_city(self, city: str) -> Tuple[str, str]:
+        """Get the (continent, country) a city belongs to"""
+        return self._city_locations.get(city, ("Unknown", "Unknown"))
+    
+    def search_cities(self, query: str) -> Tuple[str, ...]:
+        """Search cities by partial name match, ignoring case and accents"""
+        if not query:
+            return self._all_cities_sorted
+        query = fold_text(query)
+        if not query:
+            # Only characters with no ASCII form (e.g. Cyrillic or CJK), which
+            # no city name is spelled with
+            return ()
+        if not self._search_ready.is_set():
+            # Index still being built, so scan the names directly
+            return tuple(city for city, folded in zip(self._all_cities_sorted, self._all_cities_ascii)
+                         if query in folded)
+        if len(query) <= 2:
+            return self._gram_matches.get(query, ())
+        
+        # Typing and backspacing revisits the same queries, so reuse results
+        cached = self._search_cache.get(query)
+        if cached is None:
+            cached = self._search_cache[query] = tuple(self._match_cities(query))
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
+        return cached
+    
+    def _match_cities(self, query: str) -> List[str]:
+        """Find cities whose folded name contains a folded query of 3+ characters"""
+        # Only cities containing every bigram of the query can match
+        candidates = -1
+        for j in range(len(query) - 1):
+            candidates &= self._bigram_index.get(query[j:j + 2], 0)
+            if not candidates:
+                return []
+        
+        # Walk the set bits in ascending order, which keeps results sorted
+        matches = []
+        while candidates:
+            lowest = candidates & -candidates
+            i = lowest.bit_length() - 1
+            if query in self._all_cities_ascii[i]:
+                matches.append(self._all_cities_sorted[i])
+            candidates ^= lowest
+        return matches
+    
+    def _cities_from_bits(self, bits: int) -> List[str]:
+        """Decode a city bitset into names, in sorted order"""
+        cities = []
+        while bits:
+            lowest = bits & -bits
+            cities.append(self._all_cities_sorted[lowest.bit_length() - 1])
+            bits ^= lowest
+        return cities
+    
+    def get_popular_cities(self, limit: int = 50) -> Tuple[str, ...]:
         """Get most popular world cities"""
-        popular = [
-            "New York", "London", "Tokyo", "Paris", "Singapore", "Sydney", "Dubai",
-            "Hong Kong", "Los Angeles", "Barcelona", "Amsterdam", "Seoul", "Berlin",
-            "Rome", "Madrid", "Mumbai", "Bangkok", "Istanbul", "Vienna", "Prague",
-            "Buenos Aires", "São Paulo", "Mexico City", "Cairo", "Moscow", "Delhi",
-            "Shanghai", "Beijing", "Toronto", "Vancouver", "Montreal", "Chicago",
-            "San Francisco", "Miami", "Las Vegas", "Orlando", "Boston", "Washington DC"
-        ]
-        return popular[:limit]
+        return POPULAR_CITIES if limit >= len(POPULAR_CITIES) else POPULAR_CITIES[:limit]
+
+class DaemonWorkerPool:
+    """Fixed set of daemon threads running submitted calls in order
+    
+    Works like ThreadPoolExecutor, but its workers don't hold up interpreter
+    exit, so a request still in flight when the window closes is just abandoned
+    """
+    
+    __slots__ = ('_jobs', '_workers')
+    
+    def __init__(self, max_workers: int, name: str):
+        self._jobs = queue.SimpleQueue()
+        self._workers = max_workers
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True).start()
+    
+    def submit(self, func, *args) -> Future:
+        """Queue func(*args) to run on the next free worker"""
+        future = Future()
+        self._jobs.put((future, func, args))
+        return future
+    
+    def shutdown(self, cancel_pending: bool = False):
+        """Let the workers exit once queued calls are done, or cancel those calls first"""
+        if cancel_pending:
+            try:
+                while True:
+                    job = self._jobs.get_nowait()
+                    if job is not None:
+                        job[0].cancel()
+            except queue.Empty:
+                pass
+        for _ in range(self._workers):
+            self._jobs.put(None)
+    
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, func, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
 
 class WeatherAPI:
     """Weather API handler"""
     
+    __slots__ = ('api_key', 'base_url', 'units', 'session', '_cache', '_inflight', '_lock')
+    
+    # OpenWeatherMap refreshes its data roughly every 10 minutes
+    CACHE_TTL = 600
+    # Responses kept at most; the least recently used is dropped first
+    CACHE_SIZE = 128
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self.units = 'metric'
         self.session = requests.Session()
+        
+        # Keep warm connections for concurrent comparison requests and retry
+        # transient server errors instead of failing the whole lookup. Every
+        # request goes to one host, so a few pools suffice; each keeps enough
+        # sockets for a full comparison batch plus the other two tabs
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        
+        # Identical requests issued while one is already running (e.g. a
+        # double-clicked button) wait on that request instead of repeating it
+        self._inflight: Dict[Tuple, Future] = {}
+        
+        # Guards the cache and the in-flight map, which worker threads share
+        self._lock = threading.Lock()
     
-    def get_weather_data(self, city: str) -> Optional[Dict]:
-        """Fetch current weather data for a city"""
+    def _get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """GET an API endpoint, serving repeated requests from the TTL cache"""
+        # City names are matched case-insensitively by the API, so cache them that way
+        key = (endpoint, params['q'].strip().casefold(), params['units'], params.get('cnt'))
+        now = time.monotonic()
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < self.CACHE_TTL:
+                self._cache.move_to_end(key)
+                return hit[1]
+            
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        data = None
         try:
-            params = {
-                'q': city,
-                'appid': self.api_key,
-                'units': 'metric'
-            }
-            response = self.session.get(f"{self.base_url}/weather", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException:
-            return None
+            data = decode_json(response)
+        except (requests.exceptions.RequestException, ValueError):
+            pass
+        except BaseException as e:
+            # Unexpected errors reach the coalesced callers too, not just this one
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._inflight[key]
+            if data is not None:
+                self._cache[key] = (now, data)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        future.set_result(data)
+        return data
+    
+    def get_weather_data(self, city: str) -> Optional[Dict]:
+        """Fetch current weather data for a city"""
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': self.units
+        }
+        return self._get('weather', params)
     
     def get_forecast_data(self, city: str, days: int = 5) -> Optional[Dict]:
         """Fetch weather forecast data for a city"""
-        try:
-            params = {
-                'q': city,
-                'appid': self.api_key,
-                'units': 'metric',
-                'cnt': days * 8
-            }
-            response = self.session.get(f"{self.base_url}/forecast", params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException:
-            return None
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': self.units,
+            'cnt': days * 8
+        }
+        return self._get('forecast', params)
 
 class CitySelectionDialog:
     """Dialog for selecting cities"""
     
+    __slots__ = ('parent', 'cities_db', 'selected_city', 'dialog', '_search_after_id', 'search_var', 'tree',
+                 'scrollbar', '_rows', '_rows_shown')
+    
     def __init__(self, parent, cities_db: WorldCitiesDatabase):
         self.parent = parent
         self.cities_db = cities_db
         self.selected_city = None
         self.dialog = None
+        self._search_after_id = None
+        self._rows = ()
+        self._rows_shown = 0
         
     def show(self) -> Optional[str]:
         """Show city selection dialog"""
@@ -299,11 +694,11 @@ class CitySelectionDialog:
         self.tree.column('#0', width=50)
         self.tree.column('City', width=400)
         
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.tree.bind('<Double-1>', self.on_city_select)
         
@@ -317,18 +712,52 @@ class CitySelectionDialog:
         # Show popular cities by default
         self.show_popular_cities()
     
-    def populate_tree(self, cities: List[str], title: str = "Cities"):
+    def populate_tree(self, cities: Tuple[str, ...], title: str = "Cities"):
         """Populate the tree with cities"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # The database hands out the same tuple for the same listing
+        if cities is self._rows:
+            return
+        
+        # Suppress selection/focus recomputation while the tree is rebuilt
+        self.tree.configure(selectmode='none')
+        
+        # Clear existing items in a single call
+        self.tree.delete(*self.tree.get_children())
         
-        # Add cities
-        for i, city in enumerate(cities, 1):
-            self.tree.insert('', 'end', text=str(i), values=(city,))
+        # Only the first page is inserted now, the rest as the user scrolls
+        self._rows = cities
+        self._rows_shown = 0
+        self.load_more_rows()
+        
+        self.tree.configure(selectmode='browse')
+    
+    def load_more_rows(self):
+        """Insert the next page of cities into the tree"""
+        start = self._rows_shown
+        end = min(start + TREE_PAGE_SIZE, len(self._rows))
+        
+        insert = self.tree.insert
+        for i in range(start, end):
+            insert('', 'end', iid=str(i + 1), text=str(i + 1), values=(self._rows[i],))
+        
+        self._rows_shown = end
+    
+    def on_tree_scroll(self, first, last):
+        """Update the scrollbar and page in more rows near the bottom"""
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9 and self._rows_shown < len(self._rows):
+            self.load_more_rows()
     
     def on_search(self, event=None):
         """Handle search input"""
+        # Debounce so only the last keystroke within the window triggers a search
+        if self._search_after_id:
+            self.dialog.after_cancel(self._search_after_id)
+        self._search_after_id = self.dialog.after(SEARCH_DEBOUNCE_MS, self._perform_search)
+    
+    def _perform_search(self):
+        """Run the search for the current query"""
+        self._search_after_id = None
         query = self.search_var.get().strip()
         if len(query) >= 2:
             matches = self.cities_db.search_cities(query)
@@ -354,8 +783,8 @@ class CitySelectionDialog:
         
         ttk.Label(frame, text="Select a Continent:", font=('Arial', 12, 'bold')).pack(pady=(0, 10))
         
-        for continent in self.cities_db.cities.keys():
-            city_count = len(self.cities_db.get_cities_by_continent(continent))
+        for continent in self.cities_db.get_continents():
+            city_count = self.cities_db.get_continent_city_count(continent)
             btn = ttk.Button(frame, text=f"{continent} ({city_count} cities)",
                            command=lambda c=continent: self.select_continent(c, continent_dialog))
             btn.pack(fill=tk.X, pady=2)
@@ -405,9 +834,33 @@ class WeatherDashboardGUI:
         
         self.weather_api = WeatherAPI(self.api_key)
         
+        # Long-lived workers for API calls, so clicks reuse threads and
+        # concurrency stays bounded however fast the user clicks. Saving
+        # files gets its own regular worker, so a save in progress is
+        # finished rather than cut off when the window closes
+        self._executor = DaemonWorkerPool(4, 'weather')
+        # Per-city requests of a comparison get their own workers; nesting
+        # them on the pool above could deadlock it
+        self._comparison_executor = DaemonWorkerPool(MAX_COMPARISON_WORKERS, 'weather-compare')
+        self._file_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='weather-save')
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        self._browser_search_after_id = None
+        self._browser_filter_after_id = None
+        
         # Style configuration
         self.setup_styles()
         
+        # Canvases redrawn once at the end of each queue poll
+        self._dirty_canvases = set()
+        
+        # Browser tree item ids keyed by row, in display order, and the
+        # listing object they were built from
+        self._browser_iids = {}
+        self._browser_source = None
+        # What the browser tree currently shows: ('filter', value) or ('search', query)
+        self._last_browser_state = None
+        
         # Create GUI
         self.create_widgets()
         
@@ -438,8 +891,8 @@ class WeatherDashboardGUI:
         }
         
         # Set matplotlib style
-        plt.style.use('default')
-        sns.set_style("whitegrid")
+        matplotlib.rcdefaults()
+        matplotlib.rcParams.update(WHITEGRID_STYLE)
     
     def create_widgets(self):
         """Create main application widgets"""
@@ -498,6 +951,7 @@ class WeatherDashboardGUI:
         self.weather_text = scrolledtext.ScrolledText(self.weather_display_frame, 
                                                      height=20, font=('Courier', 10))
         self.weather_text.pack(fill=tk.BOTH, expand=True)
+        self.weather_text.configure(state='disabled')
 
         # Weather chart frame
         chart_frame = ttk.LabelFrame(self.weather_display_frame, text="Weather Chart", padding=10)
@@ -505,6 +959,10 @@ class WeatherDashboardGUI:
         
         # Create matplotlib figure for current weather
         self.current_weather_fig = Figure(figsize=(8, 4), dpi=100)
+        self.current_weather_axes = [self.current_weather_fig.add_subplot(2, 2, i) for i in range(1, 5)]
+        self.clear_axes(self.current_weather_axes, visible=False)
+        # (filled, empty, label) artists of each gauge, created with the first reading
+        self._gauges = None
         self.current_weather_canvas = FigureCanvasTkAgg(self.current_weather_fig, chart_frame)
         self.current_weather_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -556,6 +1014,7 @@ class WeatherDashboardGUI:
         
         self.forecast_text = scrolledtext.ScrolledText(text_frame, height=25, font=('Courier', 10))
         self.forecast_text.pack(fill=tk.BOTH, expand=True)
+        self.forecast_text.configure(state='disabled')
         
         # Chart frame
         chart_frame = ttk.LabelFrame(paned, text="Forecast Chart", padding=10)
@@ -563,6 +1022,10 @@ class WeatherDashboardGUI:
         
         # Create matplotlib figure
         self.forecast_fig = Figure(figsize=(8, 6), dpi=100)
+        self.forecast_axes = [self.forecast_fig.add_subplot(2, 1, i) for i in range(1, 3)]
+        self.clear_axes(self.forecast_axes, visible=False)
+        # Plotted lines, kept so a new forecast only swaps in its data
+        self._forecast_lines = None
         self.forecast_canvas = FigureCanvasTkAgg(self.forecast_fig, chart_frame)
         self.forecast_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
@@ -586,6 +1049,8 @@ class WeatherDashboardGUI:
         list_frame.pack(fill=tk.X, pady=(0, 10))
         
         self.cities_listbox = tk.Listbox(list_frame, height=4, font=('Arial', 10))
+        # Mirrors the listbox contents for constant-time duplicate checks
+        self._comparison_set = set()
         list_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
         self.cities_listbox.config(yscrollcommand=list_scrollbar.set)
         list_scrollbar.config(command=self.cities_listbox.yview)
@@ -617,6 +1082,8 @@ class WeatherDashboardGUI:
         # Treeview for comparison results
         columns = ('City', 'Temperature', 'Humidity', 'Pressure', 'Condition')
         self.comparison_tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=8)
+        # Row item ids by city, so a repeated comparison updates rows in place
+        self._cmp_iids = {}
         
         for col in columns:
             self.comparison_tree.heading(col, text=col)
@@ -633,6 +1100,10 @@ class WeatherDashboardGUI:
         results_paned.add(comp_chart_frame, weight=2)
         
         self.comparison_fig = Figure(figsize=(10, 6), dpi=100)
+        self.comparison_axes = [self.comparison_fig.add_subplot(2, 2, i) for i in range(1, 5)]
+        self.clear_axes(self.comparison_axes, visible=False)
+        # Artists of the last comparison, reused while the city list is unchanged
+        self._comparison_artists = None
         self.comparison_canvas = FigureCanvasTkAgg(self.comparison_fig, comp_chart_frame)
         self.comparison_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
@@ -669,7 +1140,7 @@ class WeatherDashboardGUI:
         
         self.filter_var = tk.StringVar(value="All Cities")
         filter_combo = ttk.Combobox(filter_row, textvariable=self.filter_var, 
-                                   values=["All Cities", "Popular Cities"] + list(self.cities_db.cities.keys()),
+                                   values=["All Cities", "Popular Cities", *self.cities_db.get_continents()],
                                    state="readonly", width=20)
         filter_combo.pack(side=tk.LEFT, padx=(0, 5))
         filter_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
@@ -702,8 +1173,19 @@ class WeatherDashboardGUI:
     
     def on_browser_search(self, event=None):
         """Handle search in cities browser"""
+        # Debounce so only the last keystroke within the window triggers a search
+        if self._browser_search_after_id:
+            self.root.after_cancel(self._browser_search_after_id)
+        self._browser_search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._perform_browser_search)
+    
+    def _perform_browser_search(self):
+        """Run the cities browser search for the current query"""
+        self._browser_search_after_id = None
         query = self.browser_search_var.get().strip()
         if len(query) >= 2:
+            if self._last_browser_state == ('search', query):
+                return
+            self._last_browser_state = ('search', query)
             matches = self.cities_db.search_cities(query)
             self.populate_browser_tree(matches)
         elif len(query) == 0:
@@ -711,14 +1193,29 @@ class WeatherDashboardGUI:
     
     def on_filter_change(self, event=None):
         """Handle filter change in cities browser"""
+        # Debounce so arrowing through the filter options refreshes the tree once
+        if self._browser_filter_after_id:
+            self.root.after_cancel(self._browser_filter_after_id)
+        self._browser_filter_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._apply_browser_filter)
+    
+    def _apply_browser_filter(self):
+        """Refresh the cities browser for the selected filter"""
+        self._browser_filter_after_id = None
         self.refresh_cities_browser()
     
     def refresh_cities_browser(self):
         """Refresh cities browser display"""
         filter_value = self.filter_var.get()
         
+        # Nothing to do if the tree already shows this filter
+        if self._last_browser_state == ('filter', filter_value):
+            return
+        self._last_browser_state = ('filter', filter_value)
+        
         if filter_value == "All Cities":
-            cities = self.cities_db.get_all_cities()
+            # Location of every city is already known, no lookup needed
+            self.populate_browser_rows(self.cities_db.get_city_rows())
+            return
         elif filter_value == "Popular Cities":
             cities = self.cities_db.get_popular_cities()
         elif filter_value in self.cities_db.cities:
@@ -730,22 +1227,50 @@ class WeatherDashboardGUI:
     
     def populate_browser_tree(self, cities):
         """Populate browser tree with cities"""
-        # Clear existing items
-        for item in self.browser_tree.get_children():
-            self.browser_tree.delete(item)
-        
+        # The database hands out the same tuple for the same listing
+        if cities is self._browser_source:
+            return
         # Add cities with continent and country info
-        for city in cities:
-            continent, country = self.find_city_location(city)
-            self.browser_tree.insert('', 'end', values=(city, continent, country))
+        self.populate_browser_rows([(city, *self.find_city_location(city)) for city in cities])
+        self._browser_source = cities
+    
+    def populate_browser_rows(self, rows):
+        """Populate browser tree with (city, continent, country) rows"""
+        if rows is self._browser_source:
+            return
+        self._browser_source = rows
+        
+        # Key rows by their occurrence too, so repeated rows keep separate items
+        counts = {}
+        keys = []
+        for row in rows:
+            counts[row] = counts.get(row, 0) + 1
+            keys.append((row, counts[row]))
+        
+        old_iids = self._browser_iids
+        if keys == list(old_iids):
+            return
+        
+        # Suppress selection/focus recomputation while the tree is updated
+        self.browser_tree.configure(selectmode='none')
+        
+        # Reuse items for rows that are still shown and only insert new ones
+        insert = self.browser_tree.insert
+        new_iids = {}
+        for key in keys:
+            iid = old_iids.pop(key, None)
+            new_iids[key] = iid if iid is not None else insert('', 'end', values=key[0])
+        
+        if old_iids:
+            self.browser_tree.delete(*old_iids.values())
+        self.browser_tree.set_children('', *new_iids.values())
+        self._browser_iids = new_iids
+        
+        self.browser_tree.configure(selectmode='browse')
     
     def find_city_location(self, city):
         """Find continent and country for a city"""
-        for continent, countries in self.cities_db.cities.items():
-            for country, cities in countries.items():
-                if city in cities:
-                    return continent, country
-        return "Unknown", "Unknown"
+        return self.cities_db.locate_city(city)
     
     def get_weather_from_browser(self, event=None):
         """Get weather for selected city from browser"""
@@ -781,13 +1306,18 @@ class WeatherDashboardGUI:
             return
         
         self.status_var.set(f"Fetching weather data for {city}...")
-        self.weather_text.delete(1.0, tk.END)
-        self.weather_text.insert(tk.END, "Loading weather data...\n")
+        self.set_text(self.weather_text, "Loading weather data...\n")
         
-        # Start background thread for API call
-        thread = threading.Thread(target=self.fetch_current_weather, args=(city,))
-        thread.daemon = True
-        thread.start()
+        # Run the API call on a background worker
+        self.run_in_background(city, self.fetch_current_weather, city)
+    
+    def run_in_background(self, city: str, func, *args):
+        """Run func(*args) on a worker, reporting any error it raises like a failed fetch"""
+        def report_failure(future):
+            if not future.cancelled() and future.exception() is not None:
+                self.queue.put(('error', str(future.exception()), city))
+        
+        self._executor.submit(func, *args).add_done_callback(report_failure)
     
     def fetch_current_weather(self, city):
         """Fetch current weather in background thread"""
@@ -805,23 +1335,30 @@ class WeatherDashboardGUI:
             return
         
         self.status_var.set(f"Fetching forecast data for {city}...")
-        self.forecast_text.delete(1.0, tk.END)
-        self.forecast_text.insert(tk.END, "Loading forecast data...\n")
+        self.set_text(self.forecast_text, "Loading forecast data...\n")
         
-        # Clear previous chart
-        self.forecast_fig.clear()
-        self.forecast_canvas.draw()
+        # Hide the previous chart; its lines are reused for the new data
+        for ax in self.forecast_axes:
+            ax.set_visible(False)
+        self.forecast_canvas.draw_idle()
         
-        # Start background thread for API call
-        thread = threading.Thread(target=self.fetch_forecast, args=(city,))
-        thread.daemon = True
-        thread.start()
+        # Run the API call on a background worker
+        self.run_in_background(city, self.fetch_forecast, city)
     
     def fetch_forecast(self, city):
         """Fetch forecast in background thread"""
         try:
             forecast_data = self.weather_api.get_forecast_data(city)
-            self.queue.put(('forecast', forecast_data, city))
+            
+            # Aggregate here so the UI thread only has to render the result
+            daily = None
+            if forecast_data:
+                try:
+                    daily = self.summarize_forecast(forecast_data)
+                except KeyError:
+                    pass
+            
+            self.queue.put(('forecast', (forecast_data, daily), city))
         except Exception as e:
             self.queue.put(('error', str(e), city))
     
@@ -831,28 +1368,30 @@ class WeatherDashboardGUI:
         selected_city = dialog.show()
         if selected_city:
             # Check if city already in list
-            current_cities = [self.cities_listbox.get(i) for i in range(self.cities_listbox.size())]
-            if selected_city not in current_cities:
+            if selected_city not in self._comparison_set:
                 self.cities_listbox.insert(tk.END, selected_city)
+                self._comparison_set.add(selected_city)
     
     def remove_comparison_city(self):
         """Remove selected city from comparison list"""
         selection = self.cities_listbox.curselection()
         if selection:
+            self._comparison_set.discard(self.cities_listbox.get(selection[0]))
             self.cities_listbox.delete(selection[0])
     
     def clear_comparison_cities(self):
         """Clear all cities from comparison list"""
         self.cities_listbox.delete(0, tk.END)
+        self._comparison_set.clear()
         # Clear comparison results
-        for item in self.comparison_tree.get_children():
-            self.comparison_tree.delete(item)
-        self.comparison_fig.clear()
-        self.comparison_canvas.draw()
+        self.drop_comparison_rows(set())
+        self.clear_axes(self.comparison_axes, visible=False)
+        self._comparison_artists = None
+        self.comparison_canvas.draw_idle()
     
     def compare_weather(self):
         """Compare weather for selected cities"""
-        cities = [self.cities_listbox.get(i) for i in range(self.cities_listbox.size())]
+        cities = list(self.cities_listbox.get(0, tk.END))
         
         if len(cities) < 2:
             messagebox.showwarning("Warning", "Please add at least 2 cities for comparison")
@@ -860,38 +1399,49 @@ class WeatherDashboardGUI:
         
         self.status_var.set("Fetching weather data for comparison...")
         
-        # Clear previous results
-        for item in self.comparison_tree.get_children():
-            self.comparison_tree.delete(item)
+        # Drop rows of cities no longer compared; the others are updated in
+        # place as their new results arrive
+        self.drop_comparison_rows(set(cities))
         
-        # Start background thread for comparison
-        thread = threading.Thread(target=self.fetch_comparison_data, args=(cities,))
-        thread.daemon = True
-        thread.start()
+        # Run the comparison on a background worker
+        self.run_in_background(", ".join(cities), self.fetch_comparison_data, cities)
     
     def fetch_comparison_data(self, cities):
         """Fetch comparison data in background thread"""
-        comparison_results = []
+        fetched = {}
         
-        for city in cities:
+        # Fetch all cities concurrently so total latency is the slowest
+        # request rather than the sum of all of them; each row is shown
+        # as soon as its response arrives
+        futures = {self._comparison_executor.submit(self.weather_api.get_weather_data, city): city
+                   for city in cities}
+        
+        for future in as_completed(futures):
+            city = futures[future]
             try:
-                weather_data = self.weather_api.get_weather_data(city)
+                weather_data = future.result()
                 if weather_data:
-                    comparison_results.append({
-                        'city': city,
-                        'data': weather_data
-                    })
+                    fetched[city] = weather_data
+                    self.queue.put(('comparison_row', weather_data, city))
             except Exception as e:
                 print(f"Error fetching data for {city}: {e}")
         
+        # Charts are drawn once, in the order the cities were listed
+        comparison_results = [{'city': city, 'data': fetched[city]} for city in cities if city in fetched]
         self.queue.put(('comparison', comparison_results, None))
     
+    def set_text(self, widget, text):
+        """Replace the contents of a read-only text widget in one update"""
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        if text:
+            widget.insert(tk.END, text)
+        widget.configure(state='disabled')
+    
     def display_current_weather(self, weather_data, city):
         """Display current weather data"""
-        self.weather_text.delete(1.0, tk.END)
-        
         if not weather_data:
-            self.weather_text.insert(tk.END, f"Error: Could not fetch weather data for {city}\n")
+            self.set_text(self.weather_text, f"Error: Could not fetch weather data for {city}\n")
             self.status_var.set("Error fetching weather data")
             return
         
@@ -899,57 +1449,69 @@ class WeatherDashboardGUI:
         
         # Format weather information
         weather_info = self.format_current_weather(weather_data)
-        self.weather_text.insert(tk.END, weather_info)
+        self.set_text(self.weather_text, weather_info)
         
         # Create current weather chart
         self.create_current_weather_chart(weather_data)
         
         self.status_var.set(f"Weather data loaded for {city}")
     
+    def clear_axes(self, axes, visible=True):
+        """Clear reusable chart axes in place and return them"""
+        for ax in axes:
+            ax.clear()
+            ax.set_visible(visible)
+        return axes
+    
     def create_current_weather_chart(self, weather_data):
         """Create current weather visualization chart"""
         try:
-            self.current_weather_fig.clear()
-            
             # Extract data for plotting
             temp = weather_data['main']['temp']
             feels_like = weather_data['main']['feels_like']
             humidity = weather_data['main']['humidity']
             pressure = weather_data['main']['pressure']
+            normalized_pressure = (pressure - 900) / (1100 - 900) * 100  # Normalize to 0-100
             
-            # Create subplots
-            ax1 = self.current_weather_fig.add_subplot(2, 2, 1)
-            ax2 = self.current_weather_fig.add_subplot(2, 2, 2)
-            ax3 = self.current_weather_fig.add_subplot(2, 2, 3)
-            ax4 = self.current_weather_fig.add_subplot(2, 2, 4)
-            
-            # Temperature gauge
-            ax1.pie([temp, 40-temp], colors=['#FF6B6B', '#E0E0E0'], startangle=90)
-            ax1.text(0, 0, f'{temp}°C', ha='center', va='center', fontsize=12, fontweight='bold')
-            ax1.set_title('Current Temperature', fontsize=10, fontweight='bold')
-            
-            # Feels like gauge
-            ax2.pie([feels_like, 40-feels_like], colors=['#4ECDC4', '#E0E0E0'], startangle=90)
-            ax2.text(0, 0, f'{feels_like}°C', ha='center', va='center', fontsize=12, fontweight='bold')
-            ax2.set_title('Feels Like', fontsize=10, fontweight='bold')
+            # Fraction of each gauge to fill, and the reading shown in its centre
+            readings = (
+                (temp / 40, f'{temp}°C'),
+                (feels_like / 40, f'{feels_like}°C'),
+                (humidity / 100, f'{humidity}%'),
+                (normalized_pressure / 100, f'{pressure}\nhPa'),
+            )
             
-            # Humidity gauge
-            ax3.pie([humidity, 100-humidity], colors=['#45B7D1', '#E0E0E0'], startangle=90)
-            ax3.text(0, 0, f'{humidity}%', ha='center', va='center', fontsize=12, fontweight='bold')
-            ax3.set_title('Humidity', fontsize=10, fontweight='bold')
+            if self._gauges is None:
+                self._gauges = self.create_gauges()
             
-            # Pressure gauge
-            normalized_pressure = (pressure - 900) / (1100 - 900) * 100  # Normalize to 0-100
-            ax4.pie([normalized_pressure, 100-normalized_pressure], colors=['#96CEB4', '#E0E0E0'], startangle=90)
-            ax4.text(0, 0, f'{pressure}\nhPa', ha='center', va='center', fontsize=10, fontweight='bold')
-            ax4.set_title('Pressure', fontsize=10, fontweight='bold')
+            # Move the boundary between the filled and empty wedge of each gauge
+            for (filled, empty, label), (fraction, text) in zip(self._gauges, readings):
+                boundary = 90 + 360 * min(max(fraction, 0), 1)
+                filled.set_theta2(boundary)
+                empty.set_theta1(boundary)
+                label.set_text(text)
             
-            self.current_weather_fig.tight_layout()
-            self.current_weather_canvas.draw()
+            for ax in self.current_weather_axes:
+                ax.set_visible(True)
+            self._dirty_canvases.add(self.current_weather_canvas)
             
         except Exception as e:
             print(f"Error creating current weather chart: {e}")
     
+    def create_gauges(self):
+        """Create the current weather gauges, returning (filled, empty, label) per gauge"""
+        gauges = []
+        for ax, (title, color, fontsize) in zip(self.clear_axes(self.current_weather_axes), GAUGE_STYLES):
+            filled = ax.add_patch(Wedge((0, 0), 1, 90, 90, facecolor=color))
+            empty = ax.add_patch(Wedge((0, 0), 1, 90, 450, facecolor='#E0E0E0'))
+            label = ax.text(0, 0, '', ha='center', va='center', fontsize=fontsize, fontweight='bold')
+            ax.set_title(title, fontsize=10, fontweight='bold')
+            ax.set(aspect='equal', frame_on=False, xticks=[], yticks=[], xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+            gauges.append((filled, empty, label))
+        
+        self.current_weather_fig.tight_layout()
+        return gauges
+    
     def format_current_weather(self, data):
         """Format current weather data for display"""
         try:
@@ -966,117 +1528,109 @@ class WeatherDashboardGUI:
             sunrise = datetime.fromtimestamp(data['sys']['sunrise']).strftime('%H:%M:%S')
             sunset = datetime.fromtimestamp(data['sys']['sunset']).strftime('%H:%M:%S')
             
-            weather_info = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                     CURRENT WEATHER REPORT                   ║
-╠══════════════════════════════════════════════════════════════╣
-║ Location: {city}, {country}
-║ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-║
-║ TEMPERATURE INFORMATION:
-║ ├─ Current Temperature: {temp}°C
-║ ├─ Feels Like: {feels_like}°C
-║ ├─ Condition: {description}
-║
-║ ATMOSPHERIC CONDITIONS:
-║ ├─ Humidity: {humidity}%
-║ ├─ Pressure: {pressure} hPa
-║ ├─ Visibility: {visibility/1000 if visibility != 'N/A' else 'N/A'} km
-║
-║ WIND INFORMATION:
-║ ├─ Speed: {wind_speed} m/s
-║ ├─ Direction: {wind_deg}°
-║
-║ SUN INFORMATION:
-║ ├─ Sunrise: {sunrise}
-║ ├─ Sunset: {sunset}
-║
-╚══════════════════════════════════════════════════════════════╝
-            """
-            
-            return weather_info.strip()
+            return CURRENT_WEATHER_TEMPLATE.format_map({
+                'city': city,
+                'country': country,
+                'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'temp': temp,
+                'feels_like': feels_like,
+                'description': description,
+                'humidity': humidity,
+                'pressure': pressure,
+                'visibility': visibility / 1000 if visibility != 'N/A' else 'N/A',
+                'wind_speed': wind_speed,
+                'wind_deg': wind_deg,
+                'sunrise': sunrise,
+                'sunset': sunset,
+            })
             
         except KeyError as e:
             return f"Error formatting weather data: Missing key {e}"
     
-    def display_forecast(self, forecast_data, city):
+    def display_forecast(self, forecast_data, city, daily=None):
         """Display forecast data"""
-        self.forecast_text.delete(1.0, tk.END)
-        
         if not forecast_data:
-            self.forecast_text.insert(tk.END, f"Error: Could not fetch forecast data for {city}\n")
+            self.set_text(self.forecast_text, f"Error: Could not fetch forecast data for {city}\n")
             self.status_var.set("Error fetching forecast data")
             return
         
         # Format forecast information
-        forecast_info = self.format_forecast(forecast_data)
-        self.forecast_text.insert(tk.END, forecast_info)
+        forecast_info = self.format_forecast(forecast_data, daily)
+        self.set_text(self.forecast_text, forecast_info)
         
         # Create forecast chart
         self.create_forecast_chart(forecast_data)
         
         self.status_var.set(f"Forecast data loaded for {city}")
     
-    def format_forecast(self, data):
+    def summarize_forecast(self, data) -> "pd.DataFrame":
+        """Aggregate forecast entries into one row of statistics per day"""
+        _ensure_pandas()
+        # Imported here so Numba's import cost stays off the startup path
+        from weather_kernels import daily_stats
+        
+        df = pd.json_normalize(data['list'])
+        df['time'] = to_local_datetime(df['dt'])
+        df['date'] = df['time'].dt.date
+        df['condition'] = df['weather'].str[0].str['description'].str.title()
+        df['hourly'] = ("  " + df['time'].dt.strftime('%H:%M') + ": "
+                        + df['main.temp'].map('{:>6.1f}'.format) + "°C, " + df['condition'])
+        
+        # Numeric reductions run in a single compiled pass per variable
+        bucket_ids, dates = pd.factorize(df['date'])
+        n_days = len(dates)
+        min_temp, max_temp, mean_temp = daily_stats(
+            df['main.temp'].to_numpy(dtype=np.float64), bucket_ids, n_days)
+        avg_humidity = daily_stats(df['main.humidity'].to_numpy(dtype=np.float64), bucket_ids, n_days)[2]
+        avg_pressure = daily_stats(df['main.pressure'].to_numpy(dtype=np.float64), bucket_ids, n_days)[2]
+        
+        # Most common condition and first 4 hourly lines in one pass over the rows
+        conditions: Dict = {}
+        hourly: Dict = {}
+        for day, condition, line in zip(df['date'], df['condition'], df['hourly']):
+            conditions.setdefault(day, Counter())[condition] += 1
+            lines = hourly.setdefault(day, [])
+            if len(lines) < 4:
+                lines.append(line)
+        text = pd.DataFrame({
+            'condition': [counts.most_common(1)[0][0] for counts in conditions.values()],
+            'hourly': list(hourly.values()),
+        }, index=pd.Index(list(conditions), name='date'))
+        
+        daily = pd.DataFrame({
+            'min_temp': min_temp,
+            'max_temp': max_temp,
+            'mean_temp': mean_temp,
+            'avg_humidity': avg_humidity,
+            'avg_pressure': avg_pressure,
+        }, index=pd.Index(dates, name='date'))
+        return daily.join(text)
+    
+    def format_forecast(self, data, daily=None):
         """Format forecast data for display"""
         try:
             city = data['city']['name']
             country = data['city']['country']
+            if daily is None:
+                daily = self.summarize_forecast(data)
             
-            forecast_info = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    5-DAY WEATHER FORECAST                    ║
-╠══════════════════════════════════════════════════════════════╣
-║ Location: {city}, {country}
-║ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-║
-╚══════════════════════════════════════════════════════════════╝
-
-"""
-            
-            # Group forecasts by day
-            daily_forecasts = {}
-            for item in data['list']:
-                date = datetime.fromtimestamp(item['dt']).date()
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = []
-                daily_forecasts[date].append(item)
+            forecast_info = io.StringIO()
+            forecast_info.write(FORECAST_HEADER_TEMPLATE.format_map({
+                'city': city,
+                'country': country,
+                'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }))
             
             # Display daily summaries
-            for date, forecasts in list(daily_forecasts.items())[:5]:  # Show 5 days
-                date_str = date.strftime('%A, %B %d, %Y')
-                forecast_info += f"\n{date_str}\n" + "="*60 + "\n"
-                
-                # Get daily min/max temperatures
-                temps = [f['main']['temp'] for f in forecasts]
-                min_temp = min(temps)
-                max_temp = max(temps)
-                
-                # Get most common weather condition
-                conditions = [f['weather'][0]['description'] for f in forecasts]
-                most_common_condition = max(set(conditions), key=conditions.count).title()
-                
-                # Calculate average humidity and pressure
-                avg_humidity = sum(f['main']['humidity'] for f in forecasts) / len(forecasts)
-                avg_pressure = sum(f['main']['pressure'] for f in forecasts) / len(forecasts)
-                
-                forecast_info += f"""
-Temperature Range: {min_temp:.1f}°C - {max_temp:.1f}°C
-Condition: {most_common_condition}
-Average Humidity: {avg_humidity:.0f}%
-Average Pressure: {avg_pressure:.0f} hPa
-
-Hourly Details:
-"""
-                for forecast in forecasts[:4]:  # Show first 4 hourly forecasts per day
-                    time = datetime.fromtimestamp(forecast['dt']).strftime('%H:%M')
-                    temp = forecast['main']['temp']
-                    desc = forecast['weather'][0]['description'].title()
-                    forecast_info += f"  {time}: {temp}°C, {desc}\n"
+            for date, day in daily.head(5).iterrows():  # Show 5 days
+                forecast_info.write(FORECAST_DAY_TEMPLATE.format_map(
+                    {'date': date.strftime('%A, %B %d, %Y'), **day}))
+                for line in day['hourly']:
+                    forecast_info.write(line + "\n")
                 
-                forecast_info += "\n"
+                forecast_info.write("\n")
             
-            return forecast_info
+            return forecast_info.getvalue()
             
         except KeyError as e:
             return f"Error formatting forecast data: Missing key {e}"
@@ -1084,65 +1638,88 @@ Hourly Details:
     def create_forecast_chart(self, forecast_data):
         """Create forecast chart"""
         try:
-            self.forecast_fig.clear()
-            
             # Extract data for plotting
-            timestamps = []
-            temperatures = []
-            humidity = []
+            items = forecast_data['list'][:20]  # Show first 20 forecasts (about 2.5 days)
+            epoch = np.empty(len(items), dtype=np.int64)
+            temperatures = np.empty(len(items))
+            humidity = np.empty(len(items))
+            for i, item in enumerate(items):
+                epoch[i] = item['dt']
+                temperatures[i] = item['main']['temp']
+                humidity[i] = item['main']['humidity']
+            
+            # Convert all timestamps at once; matplotlib plots datetime64 directly
+            timestamps = to_local_datetime64(epoch)
             
-            for item in forecast_data['list'][:20]:  # Show first 20 forecasts (about 2.5 days)
-                timestamps.append(datetime.fromtimestamp(item['dt']))
-                temperatures.append(item['main']['temp'])
-                humidity.append(item['main']['humidity'])
+            if self._forecast_lines:
+                # Same chart layout as last time, so only the data changes
+                temp_line, humidity_line = self._forecast_lines
+                temp_line.set_data(timestamps, temperatures)
+                humidity_line.set_data(timestamps, humidity)
+                for ax in self.forecast_axes:
+                    ax.relim()
+                    ax.autoscale_view()
+                    ax.set_visible(True)
+                self._dirty_canvases.add(self.forecast_canvas)
+                return
             
-            # Create subplots
-            ax1 = self.forecast_fig.add_subplot(2, 1, 1)
-            ax2 = self.forecast_fig.add_subplot(2, 1, 2)
+            # Reuse the subplots created with the tab
+            ax1, ax2 = self.clear_axes(self.forecast_axes)
             
             # Temperature plot
-            ax1.plot(timestamps, temperatures, color='#FF6B6B', linewidth=2, marker='o', markersize=4)
+            temp_line, = ax1.plot(timestamps, temperatures, color='#FF6B6B', linewidth=2, marker='o', markersize=4)
             ax1.set_title('Temperature Forecast', fontsize=12, fontweight='bold')
             ax1.set_ylabel('Temperature (°C)')
             ax1.grid(True, alpha=0.3)
             ax1.tick_params(axis='x', rotation=45)
             
             # Humidity plot
-            ax2.plot(timestamps, humidity, color='#4ECDC4', linewidth=2, marker='s', markersize=4)
+            humidity_line, = ax2.plot(timestamps, humidity, color='#4ECDC4', linewidth=2, marker='s', markersize=4)
             ax2.set_title('Humidity Forecast', fontsize=12, fontweight='bold')
             ax2.set_ylabel('Humidity (%)')
             ax2.set_xlabel('Time')
             ax2.grid(True, alpha=0.3)
             ax2.tick_params(axis='x', rotation=45)
             
+            self._forecast_lines = (temp_line, humidity_line)
             self.forecast_fig.tight_layout()
-            self.forecast_canvas.draw()
+            self._dirty_canvases.add(self.forecast_canvas)
             
         except Exception as e:
             print(f"Error creating forecast chart: {e}")
     
+    def add_comparison_row(self, data, city):
+        """Add a single city's result to the comparison table"""
+        temp = f"{data['main']['temp']:.1f}°C"
+        humidity = f"{data['main']['humidity']}%"
+        pressure = f"{data['main']['pressure']} hPa"
+        condition = data['weather'][0]['description'].title()
+        
+        values = (city, temp, humidity, pressure, condition)
+        iid = self._cmp_iids.get(city)
+        if iid is None:
+            self._cmp_iids[city] = self.comparison_tree.insert('', 'end', values=values)
+        else:
+            self.comparison_tree.item(iid, values=values)
+    
+    def drop_comparison_rows(self, keep):
+        """Delete comparison table rows for cities not in keep"""
+        stale = [self._cmp_iids.pop(city) for city in list(self._cmp_iids) if city not in keep]
+        if stale:
+            self.comparison_tree.delete(*stale)
+    
     def display_comparison(self, comparison_results):
         """Display weather comparison results"""
+        # Rows whose refresh failed would show stale values, so drop them and
+        # list the rest in the order the cities were added
+        self.drop_comparison_rows({result['city'] for result in comparison_results})
+        self.comparison_tree.set_children('', *(self._cmp_iids[result['city']] for result in comparison_results
+                                                if result['city'] in self._cmp_iids))
+        
         if not comparison_results:
             messagebox.showwarning("Warning", "No weather data could be retrieved for comparison")
             return
         
-        # Clear previous results
-        for item in self.comparison_tree.get_children():
-            self.comparison_tree.delete(item)
-        
-        # Populate comparison table
-        for result in comparison_results:
-            city = result['city']
-            data = result['data']
-            
-            temp = f"{data['main']['temp']:.1f}°C"
-            humidity = f"{data['main']['humidity']}%"
-            pressure = f"{data['main']['pressure']} hPa"
-            condition = data['weather'][0]['description'].title()
-            
-            self.comparison_tree.insert('', 'end', values=(city, temp, humidity, pressure, condition))
-        
         # Create comparison charts
         self.create_comparison_charts(comparison_results)
         
@@ -1151,18 +1728,26 @@ Hourly Details:
     def create_comparison_charts(self, comparison_results):
         """Create comparison charts"""
         try:
-            self.comparison_fig.clear()
+            # Gather every series in one pass, straight into arrays
+            n = len(comparison_results)
+            cities = []
+            temperatures = np.empty(n)
+            humidity = np.empty(n)
+            pressure = np.empty(n)
+            for i, result in enumerate(comparison_results):
+                main = result['data']['main']
+                cities.append(result['city'])
+                temperatures[i] = main['temp']
+                humidity[i] = main['humidity']
+                pressure[i] = main['pressure']
             
-            cities = [result['city'] for result in comparison_results]
-            temperatures = [result['data']['main']['temp'] for result in comparison_results]
-            humidity = [result['data']['main']['humidity'] for result in comparison_results]
-            pressure = [result['data']['main']['pressure'] for result in comparison_results]
+            if self._comparison_artists and self._comparison_artists[0] == cities:
+                # Same cities as last time, so only the values change
+                self.update_comparison_charts(temperatures, humidity, pressure)
+                return
             
-            # Create subplots
-            ax1 = self.comparison_fig.add_subplot(2, 2, 1)
-            ax2 = self.comparison_fig.add_subplot(2, 2, 2)
-            ax3 = self.comparison_fig.add_subplot(2, 2, 3)
-            ax4 = self.comparison_fig.add_subplot(2, 2, 4)
+            # Reuse the subplots created with the tab
+            ax1, ax2, ax3, ax4 = self.clear_axes(self.comparison_axes)
             
             # Temperature bar chart
             bars1 = ax1.bar(cities, temperatures, color='#FF6B6B', alpha=0.7)
@@ -1171,9 +1756,9 @@ Hourly Details:
             ax1.tick_params(axis='x', rotation=45)
             
             # Add value labels on bars
-            for bar, temp in zip(bars1, temperatures):
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                        f'{temp:.1f}°C', ha='center', va='bottom', fontsize=8)
+            temp_labels = [ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
+                                    f'{temp:.1f}°C', ha='center', va='bottom', fontsize=8)
+                           for bar, temp in zip(bars1, temperatures)]
             
             # Humidity bar chart
             bars2 = ax2.bar(cities, humidity, color='#4ECDC4', alpha=0.7)
@@ -1182,9 +1767,9 @@ Hourly Details:
             ax2.tick_params(axis='x', rotation=45)
             
             # Add value labels on bars
-            for bar, hum in zip(bars2, humidity):
-                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                        f'{hum}%', ha='center', va='bottom', fontsize=8)
+            humidity_labels = [ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
+                                        f'{hum:g}%', ha='center', va='bottom', fontsize=8)
+                               for bar, hum in zip(bars2, humidity)]
             
             # Pressure bar chart
             bars3 = ax3.bar(cities, pressure, color='#45B7D1', alpha=0.7)
@@ -1193,22 +1778,59 @@ Hourly Details:
             ax3.tick_params(axis='x', rotation=45)
             
             # Temperature vs Humidity scatter plot
-            ax4.scatter(temperatures, humidity, c=pressure, cmap='viridis', s=100, alpha=0.7)
+            points = ax4.scatter(temperatures, humidity, c=pressure, cmap='viridis', s=100, alpha=0.7)
             ax4.set_xlabel('Temperature (°C)')
             ax4.set_ylabel('Humidity (%)')
             ax4.set_title('Temperature vs Humidity', fontweight='bold')
             
             # Add city labels to scatter plot
-            for i, city in enumerate(cities):
-                ax4.annotate(city, (temperatures[i], humidity[i]), 
-                           xytext=(5, 5), textcoords='offset points', fontsize=8)
+            city_labels = [ax4.annotate(city, (temperatures[i], humidity[i]),
+                                        xytext=(5, 5), textcoords='offset points', fontsize=8)
+                           for i, city in enumerate(cities)]
+            
+            self._comparison_artists = (cities, bars1, temp_labels, bars2, humidity_labels,
+                                        bars3, points, city_labels)
             
             self.comparison_fig.tight_layout()
-            self.comparison_canvas.draw()
+            self._dirty_canvases.add(self.comparison_canvas)
             
         except Exception as e:
             print(f"Error creating comparison charts: {e}")
     
+    def update_comparison_charts(self, temperatures, humidity, pressure):
+        """Update the existing comparison charts in place with new values"""
+        (_, bars1, temp_labels, bars2, humidity_labels,
+         bars3, points, city_labels) = self._comparison_artists
+        
+        for bar, label, temp in zip(bars1, temp_labels, temperatures):
+            bar.set_height(temp)
+            label.set_y(temp + 0.5)
+            label.set_text(f'{temp:.1f}°C')
+        for bar, label, hum in zip(bars2, humidity_labels, humidity):
+            bar.set_height(hum)
+            label.set_y(hum + 1)
+            label.set_text(f'{hum:g}%')
+        for bar, value in zip(bars3, pressure):
+            bar.set_height(value)
+        
+        offsets = np.column_stack([temperatures, humidity])
+        points.set_offsets(offsets)
+        points.set_array(pressure)
+        points.norm.autoscale(pressure)
+        for label, xy in zip(city_labels, offsets):
+            label.xy = tuple(xy)
+        
+        ax1, ax2, ax3, ax4 = self.comparison_axes
+        for ax in (ax1, ax2, ax3):
+            ax.relim()
+            ax.autoscale_view()
+        # Collections are not covered by relim, so reset the scatter limits by hand
+        ax4.ignore_existing_data_limits = True
+        ax4.update_datalim(offsets)
+        ax4.autoscale_view()
+        
+        self._dirty_canvases.add(self.comparison_canvas)
+    
     def save_current_weather(self):
         """Save current weather data to file"""
         if not self.current_weather_data:
@@ -1221,48 +1843,84 @@ Hourly Details:
         )
         
         if filename:
-            try:
-                if filename.endswith('.json'):
-                    with open(filename, 'w') as f:
-                        json.dump(self.current_weather_data, f, indent=2)
-                else:
-                    weather_text = self.weather_text.get(1.0, tk.END)
-                    with open(filename, 'w') as f:
-                        f.write(weather_text)
-                
-                messagebox.showinfo("Success", f"Weather data saved to {filename}")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {e}")
+            # Snapshot on the UI thread, then serialize and write in the background
+            if filename.endswith('.json'):
+                self._file_executor.submit(self.write_weather_file, filename, dict(self.current_weather_data))
+            else:
+                self._file_executor.submit(self.write_weather_file, filename, self.weather_text.get(1.0, tk.END))
+    
+    def write_weather_file(self, filename, content):
+        """Write saved weather data to disk in background thread"""
+        try:
+            if isinstance(content, str):
+                with open(filename, 'w') as f:
+                    f.write(content)
+            elif orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(content, f, indent=2)
+            self.queue.put(('saved', filename, None))
+        except Exception as e:
+            self.queue.put(('save_error', str(e), None))
     
     def clear_current_weather(self):
         """Clear current weather display"""
-        self.weather_text.delete(1.0, tk.END)
+        self.set_text(self.weather_text, "")
         self.current_weather_data = {}
         self.city_var.set("")
         self.status_var.set("Ready")
     
     def process_queue(self):
         """Process messages from background threads"""
+        # Drain everything that arrived since the last poll in one go
+        messages = []
         try:
             while True:
-                message_type, data, city = self.queue.get_nowait()
-                
-                if message_type == 'current_weather':
-                    self.display_current_weather(data, city)
-                elif message_type == 'forecast':
-                    self.display_forecast(data, city)
-                elif message_type == 'comparison':
-                    self.display_comparison(data)
-                elif message_type == 'error':
-                    messagebox.showerror("Error", f"Error fetching weather data for {city}: {data}")
-                    self.status_var.set("Error occurred")
-                
+                messages.append(self.queue.get_nowait())
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.process_queue)
+        # Only the newest current weather / forecast result is worth rendering
+        latest = {message_type: i for i, (message_type, _, _) in enumerate(messages)
+                  if message_type in ('current_weather', 'forecast')}
+        
+        for i, (message_type, data, city) in enumerate(messages):
+            if message_type in latest and latest[message_type] != i:
+                continue
+            
+            if message_type == 'current_weather':
+                self.display_current_weather(data, city)
+            elif message_type == 'forecast':
+                forecast_data, daily = data
+                self.display_forecast(forecast_data, city, daily)
+            elif message_type == 'comparison_row':
+                self.add_comparison_row(data, city)
+            elif message_type == 'comparison':
+                self.display_comparison(data)
+            elif message_type == 'error':
+                messagebox.showerror("Error", f"Error fetching weather data for {city}: {data}")
+                self.status_var.set("Error occurred")
+            elif message_type == 'saved':
+                messagebox.showinfo("Success", f"Weather data saved to {data}")
+            elif message_type == 'save_error':
+                messagebox.showerror("Error", f"Failed to save file: {data}")
+        
+        # Redraw each touched chart once for the whole batch
+        for canvas in self._dirty_canvases:
+            canvas.draw_idle()
+        self._dirty_canvases.clear()
+        
+        # Poll quickly while results are flowing and back off when idle
+        self.root.after(QUEUE_POLL_BUSY_MS if messages else QUEUE_POLL_IDLE_MS, self.process_queue)
+    
+    def on_close(self):
+        """Stop background work and close the window"""
+        self._executor.shutdown(cancel_pending=True)
+        self._comparison_executor.shutdown(cancel_pending=True)
+        self._file_executor.shutdown(wait=False)
+        self.root.destroy()
     
     def run(self):
         """Run the application"""
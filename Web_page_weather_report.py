@@ -5,456 +5,120 @@ Creates a single comprehensive dashboard with all visualizations
 """
 
 import requests
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
-import json
-import os
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
-import base64
-from io import BytesIO
-import warnings
-warnings.filterwarnings('ignore')
-
-# Load environment variables
-load_dotenv()
-
-class IntegratedWeatherDashboard:
-    def __init__(self, api_key: str):
-        """
-        Initialize Integrated Weather Dashboard with API key
-        
-        Args:
-            api_key (str): OpenWeatherMap API key
-        """
-        self.api_key = api_key
-        self.base_url = "https://api.openweathermap.org/data/2.5"
-        self.session = requests.Session()
-        
-        # Set up matplotlib style for better visuals
-        plt.style.use('default')
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
-        
-        # Custom color scheme
-        self.colors = {
-            'primary': '#2E86AB',
-            'secondary': '#A23B72',
-            'accent': '#F18F01',
-            'success': '#C73E1D',
-            'background': '#F5F5F5',
-            'text': '#333333'
-        }
-        
-    def get_current_weather(self, city: str) -> Dict:
-        """Fetch current weather data for a city"""
-        url = f"{self.base_url}/weather"
-        params = {
-            'q': city,
-            'appid': self.api_key,
-            'units': 'metric'
-        }
-        
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather for {city}: {e}")
-            return {}
-    
-    def get_forecast_data(self, city: str) -> Dict:
-        """Fetch 5-day weather forecast for a city"""
-        url = f"{self.base_url}/forecast"
-        params = {
-            'q': city,
-            'appid': self.api_key,
-            'units': 'metric'
-        }
-        
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching forecast for {city}: {e}")
-            return {}
-    
-    def process_current_weather(self, data: Dict) -> Dict:
-        """Process current weather API response"""
-        if not data:
-            return {}
-            
-        return {
-            'city': data.get('name', 'Unknown'),
-            'country': data.get('sys', {}).get('country', 'Unknown'),
-            'temperature': data.get('main', {}).get('temp', 0),
-            'feels_like': data.get('main', {}).get('feels_like', 0),
-            'humidity': data.get('main', {}).get('humidity', 0),
-            'pressure': data.get('main', {}).get('pressure', 0),
-            'wind_speed': data.get('wind', {}).get('speed', 0),
-            'weather_condition': data.get('weather', [{}])[0].get('main', 'Unknown'),
-            'description': data.get('weather', [{}])[0].get('description', 'Unknown'),
-            'timestamp': datetime.now()
-        }
-    
-    def process_forecast_data(self, data: Dict) -> pd.DataFrame:
-        """Process forecast API response into DataFrame"""
-        if not data or 'list' not in data:
-            return pd.DataFrame()
-        
-        forecast_list = []
-        city_name = data.get('city', {}).get('name', 'Unknown')
-        
-        for item in data['list']:
-            forecast_list.append({
-                'city': city_name,
-                'datetime': pd.to_datetime(item['dt_txt']),
-                'temperature': item['main']['temp'],
-                'feels_like': item['main']['feels_like'],
-                'humidity': item['main']['humidity'],
-                'pressure': item['main']['pressure'],
-                'wind_speed': item.get('wind', {}).get('speed', 0),
-                'weather_condition': item['weather'][0]['main'],
-                'description': item['weather'][0]['description']
-            })
-        
-        return pd.DataFrame(forecast_list)
-    
-    def plot_to_base64(self, fig):
-        """Convert matplotlib figure to base64 string for HTML embedding"""
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        buffer.close()
-        plt.close(fig)
-        return image_base64
-    
-    def create_integrated_dashboard(self, city: str, multi_cities: List[str] = None) -> str:
-        """
-        Create integrated dashboard with all visualizations
-        
-        Args:
-            city (str): Main city for detailed analysis
-            multi_cities (List[str]): Cities for comparison
-            
-        Returns:
-            str: HTML content for the dashboard
-        """
-        print(f"Creating integrated dashboard for {city}...")
-        
-        # Get current weather
-        current_data = self.get_current_weather(city)
-        current_weather = self.process_current_weather(current_data)
-        
-        # Get forecast data
-        forecast_data = self.get_forecast_data(city)
-        df = self.process_forecast_data(forecast_data)
-        
-        if df.empty:
-            return "<h1>Unable to fetch weather data</h1>"
-        
-        # Create all visualizations
-        chart_images = {}
-        
-        # 1. Current Weather Summary Card (text-based)
-        current_summary = self.create_current_weather_html(current_weather)
-        
-        # 2. Temperature Trend Chart
-        chart_images['temp_trend'] = self.create_temperature_trend_chart(df, city)
-        
-        # 3. Weather Conditions Distribution
-        chart_images['conditions'] = self.create_conditions_chart(df, city)
-        
-        # 4. Correlation Heatmap
-        chart_images['correlation'] = self.create_correlation_chart(df, city)
-        
-        # 5. Daily Summary
-        chart_images['daily_summary'] = self.create_daily_summary_chart(df, city)
-        
-        # 6. Multi-city comparison if provided
-        if multi_cities:
-            chart_images['multi_city'] = self.create_multi_city_chart(multi_cities)
-        
-        # 7. Hourly breakdown
-        chart_images['hourly'] = self.create_hourly_chart(df, city)
-        
-        # Generate HTML dashboard
-        html_content = self.generate_html_dashboard(city, current_summary, chart_images)
-        
-        return html_content
-    
-    def create_current_weather_html(self, weather_data: Dict) -> str:
-        """Create HTML for current weather summary"""
-        if not weather_data:
-            return "<p>No current weather data available</p>"
-        
-        return f"""
-        <div class="current-weather-card">
-            <div class="weather-header">
-                <h2>{weather_data['city']}, {weather_data['country']}</h2>
-                <p class="timestamp">Last updated: {weather_data['timestamp'].strftime('%Y-%m-%d %H:%M')}</p>
-            </div>
-            <div class="weather-main">
-                <div class="temperature">
-                    <span class="temp-value">{weather_data['temperature']:.1f}°C</span>
-                    <span class="feels-like">Feels like {weather_data['feels_like']:.1f}°C</span>
-                </div>
-                <div class="condition">
-                    <h3>{weather_data['weather_condition']}</h3>
-                    <p>{weather_data['description'].title()}</p>
-                </div>
-            </div>
-            <div class="weather-details">
-                <div class="detail-item">
-                    <span class="label">Humidity</span>
-                    <span class="value">{weather_data['humidity']}%</span>
-                </div>
-                <div class="detail-item">
-                    <span class="label">Pressure</span>
-                    <span class="value">{weather_data['pressure']} hPa</span>
-                </div>
-                <div class="detail-item">
-                    <span class="label">Wind Speed</span>
-                    <span class="value">{weather_data['wind_speed']} m/s</span>
-                </div>
-            </div>
-        </div>
-        """
-    
-    def create_temperature_trend_chart(self, df: pd.DataFrame, city: str) -> str:
-        """Create temperature trend chart and return as base64"""
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        ax.plot(df['datetime'], df['temperature'], 
-               marker='o', linewidth=3, markersize=6, 
-               color=self.colors['primary'], label='Temperature')
-        ax.plot(df['datetime'], df['feels_like'], 
-               marker='s', linewidth=2, markersize=4, 
-               color=self.colors['secondary'], label='Feels Like', alpha=0.8)
-        
-        ax.fill_between(df['datetime'], df['temperature'], alpha=0.3, 
-                       color=self.colors['primary'])
-        
-        ax.set_title(f'5-Day Temperature Forecast - {city}', 
-                    fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('Date & Time', fontsize=12)
-        ax.set_ylabel('Temperature (°C)', fontsize=12)
-        ax.legend(loc='upper left')
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.tick_params(axis='x', rotation=45)
-        fig.tight_layout()
-        
-        return self.plot_to_base64(fig)
-    
-    def create_conditions_chart(self, df: pd.DataFrame, city: str) -> str:
-        """Create weather conditions chart and return as base64"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Pie chart
-        condition_counts = df['weather_condition'].value_counts()
-        colors = sns.color_palette("husl", len(condition_counts))
-        
-        wedges, texts, autotexts = ax1.pie(condition_counts.values, 
-                                          labels=condition_counts.index,
-                                          autopct='%1.1f%%', startangle=90, 
-                                          colors=colors)
-        ax1.set_title('Weather Conditions Distribution', fontsize=14, fontweight='bold')
-        
-        # Bar chart for better readability
-        ax2.bar(condition_counts.index, condition_counts.values, 
-               color=colors, alpha=0.8)
-        ax2.set_title('Weather Conditions Frequency', fontsize=14, fontweight='bold')
-        ax2.set_ylabel('Number of Occurrences')
-        ax2.tick_params(axis='x', rotation=45)
-        
-        fig.suptitle(f'Weather Patterns - {city}', fontsize=16, fontweight='bold')
-        fig.tight_layout()
-        
-        return self.plot_to_base64(fig)
-    
-    def create_correlation_chart(self, df: pd.DataFrame, city: str) -> str:
-        """Create correlation heatmap and return as base64"""
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        numeric_cols = ['temperature', 'feels_like', 'humidity', 'pressure', 'wind_speed']
-        correlation_matrix = df[numeric_cols].corr()
-        
-        mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
-        
-        sns.heatmap(correlation_matrix, mask=mask, annot=True, 
-                   cmap='RdYlBu_r', center=0, square=True, 
-                   linewidths=0.5, cbar_kws={"shrink": .8}, ax=ax)
-        
-        ax.set_title(f'Weather Variables Correlation - {city}', 
-                    fontsize=16, fontweight='bold', pad=20)
-        
-        fig.tight_layout()
-        return self.plot_to_base64(fig)
-    
-    def create_daily_summary_chart(self, df: pd.DataFrame, city: str) -> str:
-        """Create daily summary chart and return as base64"""
-        df['date'] = df['datetime'].dt.date
-        daily_summary = df.groupby('date').agg({
-            'temperature': ['min', 'max', 'mean'],
-            'humidity': 'mean',
-            'pressure': 'mean',
-            'wind_speed': 'mean'
-        }).round(2)
-        
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-        fig.suptitle(f'Daily Weather Summary - {city}', fontsize=16, fontweight='bold')
-        
-        # Temperature range
-        axes[0, 0].plot(daily_summary.index, daily_summary[('temperature', 'min')], 
-                       marker='o', label='Min Temp', color=self.colors['primary'], linewidth=2)
-        axes[0, 0].plot(daily_summary.index, daily_summary[('temperature', 'max')], 
-                       marker='o', label='Max Temp', color=self.colors['accent'], linewidth=2)
-        axes[0, 0].fill_between(daily_summary.index, 
-                               daily_summary[('temperature', 'min')],
-                               daily_summary[('temperature', 'max')], 
-                               alpha=0.3, color=self.colors['primary'])
-        axes[0, 0].set_title('Daily Temperature Range', fontweight='bold')
-        axes[0, 0].set_ylabel('Temperature (°C)')
-        axes[0, 0].legend()
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        # Humidity
-        bars1 = axes[0, 1].bar(range(len(daily_summary)), daily_summary[('humidity', 'mean')], 
-                              color=self.colors['secondary'], alpha=0.8)
-        axes[0, 1].set_title('Average Daily Humidity', fontweight='bold')
-        axes[0, 1].set_ylabel('Humidity (%)')
-        axes[0, 1].set_xticks(range(len(daily_summary)))
-        axes[0, 1].set_xticklabels([str(d) for d in daily_summary.index], rotation=45)
-        
-        # Pressure
-        axes[1, 0].plot(daily_summary.index, daily_summary[('pressure', 'mean')], 
-                       marker='s', color=self.colors['success'], linewidth=3, markersize=8)
-        axes[1, 0].set_title('Average Daily Pressure', fontweight='bold')
-        axes[1, 0].set_ylabel('Pressure (hPa)')
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        # Wind Speed
-        bars2 = axes[1, 1].bar(range(len(daily_summary)), daily_summary[('wind_speed', 'mean')], 
-                              color=self.colors['accent'], alpha=0.8)
-        axes[1, 1].set_title('Average Daily Wind Speed', fontweight='bold')
-        axes[1, 1].set_ylabel('Wind Speed (m/s)')
-        axes[1, 1].set_xticks(range(len(daily_summary)))
-        axes[1, 1].set_xticklabels([str(d) for d in daily_summary.index], rotation=45)
-        
-        plt.tight_layout()
-        return self.plot_to_base64(fig)
-    
-    def create_multi_city_chart(self, cities: List[str]) -> str:
-        """Create multi-city comparison chart and return as base64"""
-        current_data = []
-        
-        for city in cities:
-            weather_data = self.get_current_weather(city)
-            processed_data = self.process_current_weather(weather_data)
-            if processed_data:
-                current_data.append(processed_data)
-        
-        if not current_data:
-            return ""
-        
-        df = pd.DataFrame(current_data)
-        
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-        fig.suptitle('Multi-City Weather Comparison', fontsize=16, fontweight='bold')
-        
-        colors = [self.colors['primary'], self.colors['secondary'], 
-                 self.colors['accent'], self.colors['success']]
-        
-        # Temperature
-        bars1 = axes[0, 0].bar(df['city'], df['temperature'], 
-                              color=colors[:len(df)], alpha=0.8)
-        axes[0, 0].set_title('Temperature Comparison', fontweight='bold')
-        axes[0, 0].set_ylabel('Temperature (°C)')
-        axes[0, 0].tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            axes[0, 0].text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:.1f}°C', ha='center', va='bottom')
-        
-        # Humidity
-        bars2 = axes[0, 1].bar(df['city'], df['humidity'], 
-                              color=colors[:len(df)], alpha=0.8)
-        axes[0, 1].set_title('Humidity Comparison', fontweight='bold')
-        axes[0, 1].set_ylabel('Humidity (%)')
-        axes[0, 1].tick_params(axis='x', rotation=45)
-        
-        # Pressure
-        bars3 = axes[1, 0].bar(df['city'], df['pressure'], 
-                              color=colors[:len(df)], alpha=0.8)
-        axes[1, 0].set_title('Pressure Comparison', fontweight='bold')
-        axes[1, 0].set_ylabel('Pressure (hPa)')
-        axes[1, 0].tick_params(axis='x', rotation=45)
-        
-        # Wind Speed
-        bars4 = axes[1, 1].bar(df['city'], df['wind_speed'], 
-                              color=colors[:len(df)], alpha=0.8)
-        axes[1, 1].set_title('Wind Speed Comparison', fontweight='bold')
-        axes[1, 1].set_ylabel('Wind Speed (m/s)')
-        axes[1, 1].tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        return self.plot_to_base64(fig)
-    
-    def create_hourly_chart(self, df: pd.DataFrame, city: str) -> str:
-        """Create hourly breakdown chart and return as base64"""
-        df['hour'] = df['datetime'].dt.hour
-        hourly_avg = df.groupby('hour').agg({
-            'temperature': 'mean',
-            'humidity': 'mean',
-            'pressure': 'mean'
-        }).round(2)
-        
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-        fig.suptitle(f'Hourly Weather Patterns - {city}', fontsize=16, fontweight='bold')
-        
-        # Temperature by hour
-        axes[0].plot(hourly_avg.index, hourly_avg['temperature'], 
-                    marker='o', linewidth=3, markersize=8, color=self.colors['primary'])
-        axes[0].fill_between(hourly_avg.index, hourly_avg['temperature'], 
-                           alpha=0.3, color=self.colors['primary'])
-        axes[0].set_title('Average Temperature by Hour', fontweight='bold')
-        axes[0].set_xlabel('Hour of Day')
-        axes[0].set_ylabel('Temperature (°C)')
-        axes[0].grid(True, alpha=0.3)
-        axes[0].set_xticks(range(0, 24, 3))
-        
-        # Humidity by hour
-        axes[1].bar(hourly_avg.index, hourly_avg['humidity'], 
-                   color=self.colors['secondary'], alpha=0.8)
-        axes[1].set_title('Average Humidity by Hour', fontweight='bold')
-        axes[1].set_xlabel('Hour of Day')
-        axes[1].set_ylabel('Humidity (%)')
-        axes[1].set_xticks(range(0, 24, 3))
-        
-        # Pressure by hour
-        axes[2].plot(hourly_avg.index, hourly_avg['pressure'], 
-                    marker='s', linewidth=3, markersize=6, color=self.colors['success'])
-        axes[2].set_title('Average Pressure by Hour', fontweight='bold')
-        axes[2].set_xlabel('Hour of Day')
-        axes[2].set_ylabel('Pressure (hPa)')
-        axes[2].grid(True, alpha=0.3)
-        axes[2].set_xticks(range(0, 24, 3))
-        
-        plt.tight_layout()
-        return self.plot_to_base64(fig)
-    
-    def generate_html_dashboard(self, city: str, current_summary: str, chart_images: Dict[str, str]) -> str:
-        """Generate complete HTML dashboard"""
-        html_template = f"""
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import pandas as pd
+import matplotlib
+# Charts are only ever rendered to PNG, so skip loading a GUI backend
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from cycler import cycler
+from datetime import datetime, timedelta
+import json
+import os
+from typing import Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+import base64
+import functools
+import gzip
+import hashlib
+from io import BytesIO
+from string import Formatter
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import warnings
+
+from dashboard_kernels import (clothing_index, comfort_score, correlation_matrix, forecast_analytics,
+                               rain_probability_index, weather_scores)
+
+warnings.filterwarnings('ignore')
+
+# requests-cache keeps API responses on disk between runs; optional
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# orjson parses API responses faster than the json module; fall back when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables
+load_dotenv()
+
+# Rendered charts kept per dashboard instance
+CHART_CACHE_SIZE = 64
+
+# On-disk API response cache, in the user's cache directory so runs from any
+# working directory share it instead of leaving databases behind
+API_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'weather_dashboard', 'owm_cache')
+
+# Set once the first throwaway figure has been rendered in this process
+_rendering_warm = False
+
+
+@functools.lru_cache(maxsize=1)
+def api_key_from_env() -> Optional[str]:
+    """OpenWeatherMap API key from the environment or .env, looked up once per session"""
+    return os.getenv('OPENWEATHER_API_KEY')
+
+
+def decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Eight evenly spaced husl hues, precomputed so charts don't build a palette per call
+CONDITION_COLORS = ('#f77189', '#ce9032', '#97a431', '#32b166',
+                    '#36ada4', '#39a7d0', '#a48cf4', '#f561dd')
+
+# Matplotlib settings equivalent to seaborn's "whitegrid" style with the husl
+# palette, applied once instead of importing seaborn just to style the charts
+WHITEGRID_STYLE = {
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.labelcolor': '.15',
+    'axes.prop_cycle': cycler(color=CONDITION_COLORS),
+    'grid.color': '.8',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+}
+
+
+def data_digest(df: pd.DataFrame) -> str:
+    """Fingerprint the contents of a DataFrame"""
+    return hashlib.blake2b(pd.util.hash_pandas_object(df).values.tobytes(), digest_size=16).hexdigest()
+
+
+def cached_chart(render):
+    """Reuse a chart method's image while its city and data are unchanged"""
+    @functools.wraps(render)
+    def wrapper(self, df: pd.DataFrame, city: str) -> bytes:
+        key = (render.__name__, city, data_digest(df))
+        image = self._chart_cache.get(key)
+        if image is None:
+            image = self.remember_chart(key, render(self, df, city))
+        return image
+    return wrapper
+
+
+# Dashboard page layout, filled in with fill_template; braces in the CSS
+# are doubled so they survive formatting
+DASHBOARD_HEAD_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -668,41 +332,742 @@ class IntegratedWeatherDashboard:
                     <h1>🌤️ Weather Dashboard</h1>
                     <p>Comprehensive Weather Analysis & Forecast</p>
                 </div>
-                
-                <div class="dashboard-content">
-                    {current_summary}
-                    
-                    <div class="charts-grid">
-                        {"".join([
-                            f'''
-                            <div class="chart-container">
-                                <div class="chart-title">{title}</div>
-                                <img src="data:image/png;base64,{image}" alt="{title}">
-                            </div>
-                            ''' for title, image in {
-                                'Temperature Forecast': chart_images.get('temp_trend', ''),
-                                'Weather Conditions Analysis': chart_images.get('conditions', ''),
-                                'Weather Variables Correlation': chart_images.get('correlation', ''),
-                                'Daily Weather Summary': chart_images.get('daily_summary', ''),
-                                'Hourly Weather Patterns': chart_images.get('hourly', ''),
-                                'Multi-City Comparison': chart_images.get('multi_city', '')
-                            }.items() if image
-                        ])}
-                    </div>
+                
+                <div class="dashboard-content">
+                    {current_summary}
+                    
+                    <div class="charts-grid">
+                        """
+
+DASHBOARD_CHART_TEMPLATE = """
+                            <div class="chart-container">
+                                <div class="chart-title">{title}</div>
+                                <img src="{source}" alt="{title}">
+                            </div>
+                            """
+
+DASHBOARD_FOOT_TEMPLATE = """
+                    </div>
+                </div>
+                
+                <div class="footer">
+                    <p>Data provided by OpenWeatherMap API | Generated on {timestamp}</p>
+                    <p>Weather Dashboard v2.0 | Refresh for latest data</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+# (title, chart name) in the order the charts appear on the page
+DASHBOARD_CHARTS = (
+    ('Temperature Forecast', 'temp_trend'),
+    ('Weather Conditions Analysis', 'conditions'),
+    ('Weather Variables Correlation', 'correlation'),
+    ('Daily Weather Summary', 'daily_summary'),
+    ('Hourly Weather Patterns', 'hourly'),
+    ('Multi-City Comparison', 'multi_city'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(template: str) -> tuple:
+    """Split a str.format template into (literal, field name) pairs, once per template"""
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def fill_template(template: str, values: Dict) -> str:
+    """
+    Fill a template like str.format_map, without re-parsing it on every call
+    
+    The dashboard shell is mostly static CSS, so once it is split into
+    literal pieces, filling it is a single join.
+    """
+    parts = []
+    for literal, field in compile_template(template):
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(values[field]))
+    return ''.join(parts)
+
+
+class IntegratedWeatherDashboard:
+    def __init__(self, api_key: str):
+        """
+        Initialize Integrated Weather Dashboard with API key
+        
+        Args:
+            api_key (str): OpenWeatherMap API key
+        """
+        self.api_key = api_key
+        self.base_url = "https://api.openweathermap.org/data/2.5"
+        
+        # OpenWeatherMap updates every 10 minutes, so repeat lookups within
+        # that window are served from a local SQLite cache when available.
+        # The API key is left out of cache keys so it is never written to disk
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name=API_CACHE_PATH, backend='sqlite', expire_after=600,
+                stale_if_error=3600, cache_control=True, ignored_parameters=['appid'])
+        else:
+            self.session = requests.Session()
+        
+        # Cities are fetched in parallel, so keep enough pooled keep-alive
+        # connections for all of them to reuse. Every request goes to one
+        # host, so a few pools suffice. Transient server errors and rate
+        # limiting are retried instead of dropping that city from the page
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        
+        # Set up matplotlib style for better visuals
+        plt.style.use('default')
+        matplotlib.rcParams.update(WHITEGRID_STYLE)
+        
+        # Base64 chart images keyed by (chart, city, data fingerprint)
+        self._chart_cache = {}
+        
+        # One (figure, axes) per chart, reused for every city
+        self._figures = {}
+        
+        # Requests started by prefetch(), keyed by (kind, city) and used up
+        # by the next fetch_dashboard_data for that city
+        self._prefetched = {}
+        self._prefetch_executor = None
+        
+        # Custom color scheme
+        self.colors = {
+            'primary': '#2E86AB',
+            'secondary': '#A23B72',
+            'accent': '#F18F01',
+            'success': '#C73E1D',
+            'background': '#F5F5F5',
+            'text': '#333333'
+        }
+        
+    def get_current_weather(self, city: str) -> Dict:
+        """Fetch current weather data for a city"""
+        url = f"{self.base_url}/weather"
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': 'metric'
+        }
+        
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            return decode_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error fetching weather for {city}: {e}")
+            return {}
+    
+    def get_forecast_data(self, city: str) -> Dict:
+        """Fetch 5-day weather forecast for a city"""
+        url = f"{self.base_url}/forecast"
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': 'metric'
+        }
+        
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            return decode_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error fetching forecast for {city}: {e}")
+            return {}
+    
+    def process_current_weather(self, data: Dict) -> Dict:
+        """Process current weather API response"""
+        if not data:
+            return {}
+        
+        main = data.get('main', {})
+        weather = (data.get('weather') or [{}])[0]
+        return {
+            'city': data.get('name', 'Unknown'),
+            'country': data.get('sys', {}).get('country', 'Unknown'),
+            'temperature': main.get('temp', 0),
+            'feels_like': main.get('feels_like', 0),
+            'humidity': main.get('humidity', 0),
+            'pressure': main.get('pressure', 0),
+            'wind_speed': data.get('wind', {}).get('speed', 0),
+            'weather_condition': weather.get('main', 'Unknown'),
+            'description': weather.get('description', 'Unknown'),
+            'timestamp': datetime.now()
+        }
+    
+    def process_forecast_data(self, data: Dict) -> pd.DataFrame:
+        """Process forecast API response into DataFrame"""
+        if not data or 'list' not in data:
+            return pd.DataFrame()
+        
+        city_name = data.get('city', {}).get('name', 'Unknown')
+        
+        # Pull each column straight out of the entries with list
+        # comprehensions; for a few dozen rows this is several times cheaper
+        # than pd.json_normalize building every nested column
+        entries = data['list']
+        count = len(entries)
+        mains = [entry.get('main', {}) for entry in entries]
+        weather = [(entry.get('weather') or [{}])[0] for entry in entries]
+        conditions = [item.get('main', 'Unknown') for item in weather]
+        
+        # Compact dtypes: float32 is plenty for readings, humidity is a
+        # percentage and pressure fits in 16 bits. Conditions are a handful of
+        # repeated labels; categories keep first-seen order so ties in
+        # value_counts() come out as before
+        return pd.DataFrame({
+            'city': city_name,
+            'datetime': pd.to_datetime([entry['dt_txt'] for entry in entries], format='%Y-%m-%d %H:%M:%S'),
+            'temperature': np.fromiter([main.get('temp', 0) for main in mains], np.float32, count),
+            'feels_like': np.fromiter([main.get('feels_like', 0) for main in mains], np.float32, count),
+            'humidity': np.fromiter([main.get('humidity', 0) for main in mains], np.uint8, count),
+            'pressure': np.fromiter([main.get('pressure', 0) for main in mains], np.uint16, count),
+            'wind_speed': np.fromiter([entry.get('wind', {}).get('speed') or 0 for entry in entries],
+                                      np.float32, count),
+            'weather_condition': pd.Categorical(conditions, categories=list(dict.fromkeys(conditions))),
+            'description': [item.get('description', 'Unknown') for item in weather],
+        })
+    
+    def plot_to_png(self, fig) -> bytes:
+        """Render a matplotlib figure to PNG bytes"""
+        buffer = BytesIO()
+        # Figures are already laid out with tight_layout, so skip the extra
+        # bbox_inches='tight' render pass; fast zlib level for large PNGs
+        fig.savefig(buffer, format='png', dpi=150, facecolor='white', edgecolor='none',
+                    pil_kwargs={'compress_level': 1})
+        image = buffer.getvalue()
+        buffer.close()
+        return image
+    
+    def plot_to_base64(self, fig):
+        """Convert matplotlib figure to base64 string for HTML embedding"""
+        return base64.b64encode(self.plot_to_png(fig)).decode('utf-8')
+    
+    def chart_figure(self, name: str, nrows: int = 1, ncols: int = 1, figsize=None):
+        """Get the reusable figure and axes for a chart, cleared for drawing"""
+        if name not in self._figures:
+            fig = Figure(figsize=figsize)
+            self._figures[name] = (fig, fig.subplots(nrows, ncols))
+            return self._figures[name]
+        
+        fig, axes = self._figures[name]
+        grid = np.ravel(axes)
+        # Extra axes such as colorbars belong to the previous render; remove
+        # them first so their host axes get its space back before clearing
+        for ax in fig.axes:
+            if ax not in grid:
+                ax.remove()
+        # Undo the previous layout pass so every render starts from the
+        # same geometry a freshly created figure would have
+        fig.subplotpars.reset()
+        for ax in grid:
+            ax.clear()
+            ax.set_position(ax.get_subplotspec().get_position(fig))
+        return fig, axes
+    
+    def fetch_dashboard_data(self, city: str, multi_cities: List[str] = None):
+        """
+        Fetch current weather, forecast and comparison city data concurrently
+        
+        Args:
+            city (str): Main city for detailed analysis
+            multi_cities (List[str]): Cities for comparison
+            
+        Returns:
+            tuple: (current weather, forecast, list of comparison city weather)
+        """
+        multi_cities = multi_cities or []
+        
+        # All requests share one pool, so total time is the slowest request
+        with ThreadPoolExecutor(max_workers=min(16, len(multi_cities) + 2)) as executor:
+            current_future = (self._prefetched.pop(('current', city), None)
+                              or executor.submit(self.get_current_weather, city))
+            forecast_future = (self._prefetched.pop(('forecast', city), None)
+                               or executor.submit(self.get_forecast_data, city))
+            multi_futures = [executor.submit(self.get_current_weather, c) for c in multi_cities]
+            
+            # Use the time spent waiting on the network to pay matplotlib's
+            # one-off start-up costs
+            self.warm_up_rendering()
+            
+            return (current_future.result(), forecast_future.result(),
+                    [future.result() for future in multi_futures])
+    
+    def prefetch(self, city: str):
+        """
+        Start fetching a city's current weather and forecast in the background,
+        e.g. while the user is still typing the comparison cities
+        
+        Args:
+            city (str): Main city of the next dashboard
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=2)
+        self._prefetched[('current', city)] = self._prefetch_executor.submit(self.get_current_weather, city)
+        self._prefetched[('forecast', city)] = self._prefetch_executor.submit(self.get_forecast_data, city)
+    
+    def discard_prefetched(self):
+        """Drop prefetched requests no dashboard used and stop the prefetch worker"""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+    
+    def warm_up_rendering(self):
+        """Render a throwaway figure once so fonts, text layout and Agg are initialized"""
+        global _rendering_warm
+        if _rendering_warm:
+            return
+        _rendering_warm = True
+        
+        fig = Figure(figsize=(2, 2))
+        ax = fig.subplots()
+        ax.plot([0, 1], [0, 1], marker='o')
+        ax.set_title('Warm-up', fontweight='bold')
+        ax.set_xlabel('°C')
+        fig.tight_layout()
+        fig.savefig(BytesIO(), format='png', dpi=150)
+    
+    def remember_chart(self, key, image: bytes) -> bytes:
+        """Store a rendered chart, dropping the oldest once the cache is full"""
+        if len(self._chart_cache) >= CHART_CACHE_SIZE:
+            del self._chart_cache[next(iter(self._chart_cache))]
+        self._chart_cache[key] = image
+        return image
+    
+    def create_integrated_dashboard(self, city: str, multi_cities: List[str] = None) -> str:
+        """
+        Create integrated dashboard with all visualizations
+        
+        Args:
+            city (str): Main city for detailed analysis
+            multi_cities (List[str]): Cities for comparison
+            
+        Returns:
+            str: HTML content for the dashboard
+        """
+        return "".join(self.iter_integrated_dashboard(city, multi_cities))
+    
+    def iter_integrated_dashboard(self, city: str, multi_cities: List[str] = None,
+                                  asset_dir: str = None) -> Iterator[str]:
+        """
+        Create integrated dashboard and yield its HTML in chunks
+        
+        Args:
+            city (str): Main city for detailed analysis
+            multi_cities (List[str]): Cities for comparison
+            asset_dir (str): Save charts as PNG files in this directory instead
+                of embedding them in the page
+        """
+        print(f"Creating integrated dashboard for {city}...")
+        
+        # Fetch everything the dashboard needs in a single concurrent batch
+        current_data, forecast_data, multi_city_data = self.fetch_dashboard_data(city, multi_cities)
+        
+        current_weather = self.process_current_weather(current_data)
+        df = self.process_forecast_data(forecast_data)
+        
+        if df.empty:
+            yield "<h1>Unable to fetch weather data</h1>"
+            return
+        
+        # Create all visualizations
+        chart_images = {}
+        
+        # 1. Current Weather Summary Card (text-based)
+        current_summary = self.create_current_weather_html(current_weather)
+        
+        # 2. Temperature Trend Chart
+        chart_images['temp_trend'] = self.create_temperature_trend_chart(df, city)
+        
+        # 3. Weather Conditions Distribution
+        chart_images['conditions'] = self.create_conditions_chart(df, city)
+        
+        # 4. Correlation Heatmap
+        chart_images['correlation'] = self.create_correlation_chart(df, city)
+        
+        # 5. Daily Summary
+        chart_images['daily_summary'] = self.create_daily_summary_chart(df, city)
+        
+        # 6. Multi-city comparison if provided
+        if multi_cities:
+            chart_images['multi_city'] = self.create_multi_city_chart(multi_cities, multi_city_data)
+        
+        # 7. Hourly breakdown
+        chart_images['hourly'] = self.create_hourly_chart(df, city)
+        
+        image_sources = self.write_chart_assets(chart_images, asset_dir) if asset_dir else None
+        
+        # Generate HTML dashboard
+        yield from self.iter_html_dashboard(city, current_summary, chart_images, image_sources)
+    
+    def write_chart_assets(self, chart_images: Dict[str, bytes], asset_dir: str) -> Dict[str, str]:
+        """Write charts to PNG files and return their paths relative to the dashboard"""
+        os.makedirs(asset_dir, exist_ok=True)
+        image_sources = {}
+        for name, image in chart_images.items():
+            if image:
+                with open(os.path.join(asset_dir, f"{name}.png"), 'wb') as f:
+                    f.write(image)
+                image_sources[name] = f"{quote(os.path.basename(asset_dir))}/{name}.png"
+        return image_sources
+    
+    def create_current_weather_html(self, weather_data: Dict) -> str:
+        """Create HTML for current weather summary"""
+        if not weather_data:
+            return "<p>No current weather data available</p>"
+        
+        return f"""
+        <div class="current-weather-card">
+            <div class="weather-header">
+                <h2>{weather_data['city']}, {weather_data['country']}</h2>
+                <p class="timestamp">Last updated: {weather_data['timestamp'].strftime('%Y-%m-%d %H:%M')}</p>
+            </div>
+            <div class="weather-main">
+                <div class="temperature">
+                    <span class="temp-value">{weather_data['temperature']:.1f}°C</span>
+                    <span class="feels-like">Feels like {weather_data['feels_like']:.1f}°C</span>
+                </div>
+                <div class="condition">
+                    <h3>{weather_data['weather_condition']}</h3>
+                    <p>{weather_data['description'].title()}</p>
                 </div>
-                
-                <div class="footer">
-                    <p>Data provided by OpenWeatherMap API | Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p>Weather Dashboard v2.0 | Refresh for latest data</p>
+            </div>
+            <div class="weather-details">
+                <div class="detail-item">
+                    <span class="label">Humidity</span>
+                    <span class="value">{weather_data['humidity']}%</span>
+                </div>
+                <div class="detail-item">
+                    <span class="label">Pressure</span>
+                    <span class="value">{weather_data['pressure']} hPa</span>
+                </div>
+                <div class="detail-item">
+                    <span class="label">Wind Speed</span>
+                    <span class="value">{weather_data['wind_speed']} m/s</span>
                 </div>
             </div>
-        </body>
-        </html>
+        </div>
+        """
+    
+    @cached_chart
+    def create_temperature_trend_chart(self, df: pd.DataFrame, city: str) -> bytes:
+        """Create temperature trend chart and return it as PNG bytes"""
+        fig, ax = self.chart_figure('temp_trend', figsize=(12, 6))
+        
+        ax.plot(df['datetime'], df['temperature'], 
+               marker='o', linewidth=3, markersize=6, 
+               color=self.colors['primary'], label='Temperature')
+        ax.plot(df['datetime'], df['feels_like'], 
+               marker='s', linewidth=2, markersize=4, 
+               color=self.colors['secondary'], label='Feels Like', alpha=0.8)
+        
+        ax.fill_between(df['datetime'], df['temperature'], alpha=0.3, 
+                       color=self.colors['primary'])
+        
+        ax.set_title(f'5-Day Temperature Forecast - {city}', 
+                    fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Date & Time', fontsize=12)
+        ax.set_ylabel('Temperature (°C)', fontsize=12)
+        ax.legend(loc='upper left')
+        ax.grid(True, alpha=0.3)
+        
+        # Format x-axis
+        ax.tick_params(axis='x', rotation=45)
+        fig.tight_layout()
+        
+        return self.plot_to_png(fig)
+    
+    @cached_chart
+    def create_conditions_chart(self, df: pd.DataFrame, city: str) -> bytes:
+        """Create weather conditions chart and return it as PNG bytes"""
+        fig, (ax1, ax2) = self.chart_figure('conditions', 1, 2, figsize=(14, 6))
+        
+        # Pie chart
+        # Conditions are categorical, so count the integer codes and order by
+        # frequency; the stable sort keeps first-seen order for ties
+        conditions = df['weather_condition'].cat
+        counts = np.bincount(conditions.codes.to_numpy(), minlength=len(conditions.categories))
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        condition_counts = counts[order]
+        condition_labels = conditions.categories[order]
+        # Spread the picks over the hue wheel, wrapping when there are more
+        # conditions than colors
+        picks = np.arange(len(condition_counts)) * len(CONDITION_COLORS) // max(len(condition_counts), 1)
+        colors = [CONDITION_COLORS[i % len(CONDITION_COLORS)] for i in picks]
+        
+        wedges, texts, autotexts = ax1.pie(condition_counts, 
+                                          labels=condition_labels,
+                                          autopct='%1.1f%%', startangle=90, 
+                                          colors=colors)
+        ax1.set_title('Weather Conditions Distribution', fontsize=14, fontweight='bold')
+        
+        # Bar chart for better readability
+        ax2.bar(condition_labels, condition_counts, 
+               color=colors, alpha=0.8)
+        ax2.set_title('Weather Conditions Frequency', fontsize=14, fontweight='bold')
+        ax2.set_ylabel('Number of Occurrences')
+        ax2.tick_params(axis='x', rotation=45)
+        
+        fig.suptitle(f'Weather Patterns - {city}', fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        
+        return self.plot_to_png(fig)
+    
+    @cached_chart
+    def create_correlation_chart(self, df: pd.DataFrame, city: str) -> bytes:
+        """Create correlation heatmap and return it as PNG bytes"""
+        fig, ax = self.chart_figure('correlation', figsize=(10, 8))
+        
+        numeric_cols = ['temperature', 'feels_like', 'humidity', 'pressure', 'wind_speed']
+        # Stacking the columns directly is cheaper than df[numeric_cols].to_numpy()
+        values = np.column_stack([df[col].to_numpy(dtype=np.float64) for col in numeric_cols])
+        correlations = pd.DataFrame(correlation_matrix(values),
+                                    index=numeric_cols, columns=numeric_cols)
+        
+        # Only the lower triangle is drawn; the rest mirrors it
+        mask = np.triu(np.ones_like(correlations, dtype=bool))
+        cells = np.ma.masked_array(correlations.to_numpy(), mask)
+        
+        mesh = ax.pcolormesh(cells, cmap='RdYlBu_r', vmin=-1, vmax=1,
+                             edgecolors='white', linewidth=0.5)
+        fig.colorbar(mesh, ax=ax, shrink=.8)
+        
+        ax.set_aspect('equal')
+        ax.invert_yaxis()
+        ticks = np.arange(len(numeric_cols)) + 0.5
+        ax.set_xticks(ticks, numeric_cols)
+        ax.set_yticks(ticks, numeric_cols, rotation=90, va='center')
+        ax.tick_params(length=0)
+        ax.grid(False)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        
+        # Dark text on light cells and light text on dark ones
+        rgba = mesh.to_rgba(cells.filled(0))
+        luminance = rgba[..., :3] @ np.array([0.2126, 0.7152, 0.0722])
+        for row, col in zip(*np.nonzero(~mask)):
+            ax.text(col + 0.5, row + 0.5, f'{cells[row, col]:.2g}',
+                    ha='center', va='center',
+                    color='black' if luminance[row, col] > 0.408 else 'white')
+        
+        ax.set_title(f'Weather Variables Correlation - {city}', 
+                    fontsize=16, fontweight='bold', pad=20)
+        
+        fig.tight_layout()
+        return self.plot_to_png(fig)
+    
+    @cached_chart
+    def create_daily_summary_chart(self, df: pd.DataFrame, city: str) -> bytes:
+        """Create daily summary chart and return it as PNG bytes"""
+        # Sort rows by day and reduce each run of equal days with ufunc.reduceat;
+        # for a few dozen rows this avoids pandas' groupby machinery entirely
+        days = df['datetime'].to_numpy().astype('datetime64[D]')
+        order = np.argsort(days, kind='stable')
+        days = days[order]
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        counts = np.diff(np.r_[starts, len(days)])
+        
+        def daily_mean(column):
+            return np.add.reduceat(df[column].to_numpy(dtype=np.float64)[order], starts) / counts
+        
+        temperature = df['temperature'].to_numpy()[order]
+        daily_summary = pd.DataFrame({
+            'humidity': daily_mean('humidity'),
+            'pressure': daily_mean('pressure'),
+            'wind_speed': daily_mean('wind_speed'),
+            'temp_min': np.minimum.reduceat(temperature, starts),
+            'temp_max': np.maximum.reduceat(temperature, starts),
+        }, index=days[starts].astype(object))
+        
+        fig, axes = self.chart_figure('daily_summary', 2, 2, figsize=(15, 10))
+        fig.suptitle(f'Daily Weather Summary - {city}', fontsize=16, fontweight='bold')
+        
+        # Temperature range
+        axes[0, 0].plot(daily_summary.index, daily_summary['temp_min'], 
+                       marker='o', label='Min Temp', color=self.colors['primary'], linewidth=2)
+        axes[0, 0].plot(daily_summary.index, daily_summary['temp_max'], 
+                       marker='o', label='Max Temp', color=self.colors['accent'], linewidth=2)
+        axes[0, 0].fill_between(daily_summary.index, 
+                               daily_summary['temp_min'],
+                               daily_summary['temp_max'], 
+                               alpha=0.3, color=self.colors['primary'])
+        axes[0, 0].set_title('Daily Temperature Range', fontweight='bold')
+        axes[0, 0].set_ylabel('Temperature (°C)')
+        axes[0, 0].legend()
+        axes[0, 0].grid(True, alpha=0.3)
+        
+        # Humidity
+        bars1 = axes[0, 1].bar(range(len(daily_summary)), daily_summary['humidity'], 
+                              color=self.colors['secondary'], alpha=0.8)
+        axes[0, 1].set_title('Average Daily Humidity', fontweight='bold')
+        axes[0, 1].set_ylabel('Humidity (%)')
+        axes[0, 1].set_xticks(range(len(daily_summary)))
+        axes[0, 1].set_xticklabels([str(d) for d in daily_summary.index], rotation=45)
+        
+        # Pressure
+        axes[1, 0].plot(daily_summary.index, daily_summary['pressure'], 
+                       marker='s', color=self.colors['success'], linewidth=3, markersize=8)
+        axes[1, 0].set_title('Average Daily Pressure', fontweight='bold')
+        axes[1, 0].set_ylabel('Pressure (hPa)')
+        axes[1, 0].grid(True, alpha=0.3)
+        
+        # Wind Speed
+        bars2 = axes[1, 1].bar(range(len(daily_summary)), daily_summary['wind_speed'], 
+                              color=self.colors['accent'], alpha=0.8)
+        axes[1, 1].set_title('Average Daily Wind Speed', fontweight='bold')
+        axes[1, 1].set_ylabel('Wind Speed (m/s)')
+        axes[1, 1].set_xticks(range(len(daily_summary)))
+        axes[1, 1].set_xticklabels([str(d) for d in daily_summary.index], rotation=45)
+        
+        fig.tight_layout()
+        return self.plot_to_png(fig)
+    
+    def create_multi_city_chart(self, cities: List[str], weather_data: List[Dict] = None) -> bytes:
+        """Create multi-city comparison chart and return it as PNG bytes"""
+        if not cities:
+            return b""
+        
+        # Fetch all cities at once unless the caller already did
+        if weather_data is None:
+            with ThreadPoolExecutor(max_workers=min(16, len(cities))) as executor:
+                weather_data = list(executor.map(self.get_current_weather, cities))
+        
+        current_data = []
+        for data in weather_data:
+            processed_data = self.process_current_weather(data)
+            if processed_data:
+                current_data.append(processed_data)
+        
+        if not current_data:
+            return b""
+        
+        df = pd.DataFrame(current_data)
+        
+        # The processing timestamp differs on every run, so leave it out of the key
+        key = ('multi_city', data_digest(df.drop(columns='timestamp')))
+        if key in self._chart_cache:
+            return self._chart_cache[key]
+        
+        fig, axes = self.chart_figure('multi_city', 2, 2, figsize=(15, 10))
+        fig.suptitle('Multi-City Weather Comparison', fontsize=16, fontweight='bold')
+        
+        colors = [self.colors['primary'], self.colors['secondary'], 
+                 self.colors['accent'], self.colors['success']]
+        
+        # Temperature
+        bars1 = axes[0, 0].bar(df['city'], df['temperature'], 
+                              color=colors[:len(df)], alpha=0.8)
+        axes[0, 0].set_title('Temperature Comparison', fontweight='bold')
+        axes[0, 0].set_ylabel('Temperature (°C)')
+        axes[0, 0].tick_params(axis='x', rotation=45)
+        
+        # Add value labels on bars
+        for bar in bars1:
+            height = bar.get_height()
+            axes[0, 0].text(bar.get_x() + bar.get_width()/2., height,
+                           f'{height:.1f}°C', ha='center', va='bottom')
+        
+        # Humidity
+        bars2 = axes[0, 1].bar(df['city'], df['humidity'], 
+                              color=colors[:len(df)], alpha=0.8)
+        axes[0, 1].set_title('Humidity Comparison', fontweight='bold')
+        axes[0, 1].set_ylabel('Humidity (%)')
+        axes[0, 1].tick_params(axis='x', rotation=45)
+        
+        # Pressure
+        bars3 = axes[1, 0].bar(df['city'], df['pressure'], 
+                              color=colors[:len(df)], alpha=0.8)
+        axes[1, 0].set_title('Pressure Comparison', fontweight='bold')
+        axes[1, 0].set_ylabel('Pressure (hPa)')
+        axes[1, 0].tick_params(axis='x', rotation=45)
+        
+        # Wind Speed
+        bars4 = axes[1, 1].bar(df['city'], df['wind_speed'], 
+                              color=colors[:len(df)], alpha=0.8)
+        axes[1, 1].set_title('Wind Speed Comparison', fontweight='bold')
+        axes[1, 1].set_ylabel('Wind Speed (m/s)')
+        axes[1, 1].tick_params(axis='x', rotation=45)
+        
+        fig.tight_layout()
+        return self.remember_chart(key, self.plot_to_png(fig))
+    
+    @cached_chart
+    def create_hourly_chart(self, df: pd.DataFrame, city: str) -> bytes:
+        """Create hourly breakdown chart and return it as PNG bytes"""
+        hourly_avg = df.groupby(df['datetime'].dt.hour.rename('hour'))[
+            ['temperature', 'humidity', 'pressure']].mean()
+        
+        fig, axes = self.chart_figure('hourly', 1, 3, figsize=(18, 6))
+        fig.suptitle(f'Hourly Weather Patterns - {city}', fontsize=16, fontweight='bold')
+        
+        # Temperature by hour
+        axes[0].plot(hourly_avg.index, hourly_avg['temperature'], 
+                    marker='o', linewidth=3, markersize=8, color=self.colors['primary'])
+        axes[0].fill_between(hourly_avg.index, hourly_avg['temperature'], 
+                           alpha=0.3, color=self.colors['primary'])
+        axes[0].set_title('Average Temperature by Hour', fontweight='bold')
+        axes[0].set_xlabel('Hour of Day')
+        axes[0].set_ylabel('Temperature (°C)')
+        axes[0].grid(True, alpha=0.3)
+        axes[0].set_xticks(range(0, 24, 3))
+        
+        # Humidity by hour
+        axes[1].bar(hourly_avg.index, hourly_avg['humidity'], 
+                   color=self.colors['secondary'], alpha=0.8)
+        axes[1].set_title('Average Humidity by Hour', fontweight='bold')
+        axes[1].set_xlabel('Hour of Day')
+        axes[1].set_ylabel('Humidity (%)')
+        axes[1].set_xticks(range(0, 24, 3))
+        
+        # Pressure by hour
+        axes[2].plot(hourly_avg.index, hourly_avg['pressure'], 
+                    marker='s', linewidth=3, markersize=6, color=self.colors['success'])
+        axes[2].set_title('Average Pressure by Hour', fontweight='bold')
+        axes[2].set_xlabel('Hour of Day')
+        axes[2].set_ylabel('Pressure (hPa)')
+        axes[2].grid(True, alpha=0.3)
+        axes[2].set_xticks(range(0, 24, 3))
+        
+        fig.tight_layout()
+        return self.plot_to_png(fig)
+    
+    def generate_html_dashboard(self, city: str, current_summary: str, chart_images: Dict[str, bytes]) -> str:
+        """Generate complete HTML dashboard"""
+        return "".join(self.iter_html_dashboard(city, current_summary, chart_images))
+    
+    def iter_html_dashboard(self, city: str, current_summary: str, chart_images: Dict[str, bytes],
+                            image_sources: Dict[str, str] = None) -> Iterator[str]:
         """
+        Yield the HTML dashboard in chunks, one per chart, so it can be written as it goes
         
-        return html_template
+        chart_images holds PNG bytes. Charts listed in image_sources are
+        linked by that URL; only the rest are base64-encoded into data URIs.
+        """
+        image_sources = image_sources or {}
+        yield fill_template(DASHBOARD_HEAD_TEMPLATE, {'city': city, 'current_summary': current_summary})
+        
+        for title, name in DASHBOARD_CHARTS:
+            image = chart_images.get(name)
+            if image:
+                source = (image_sources.get(name)
+                          or f"data:image/png;base64,{base64.b64encode(image).decode('ascii')}")
+                yield fill_template(DASHBOARD_CHART_TEMPLATE, {'title': title, 'source': source})
+        
+        yield fill_template(DASHBOARD_FOOT_TEMPLATE, {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
     
-    def save_dashboard(self, city: str, multi_cities: List[str] = None, filename: str = None) -> str:
+    def save_dashboard(self, city: str, multi_cities: List[str] = None, filename: str = None,
+                       compress: bool = False, embed_images: bool = False) -> str:
         """
         Generate and save integrated dashboard as HTML file
         
@@ -710,6 +1075,10 @@ class IntegratedWeatherDashboard:
             city (str): Main city for analysis
             multi_cities (List[str]): Cities for comparison
             filename (str): Output filename
+            compress (bool): Write a gzip-compressed .html.gz file instead
+            embed_images (bool): Embed charts in the page as base64 data URIs
+                for a single self-contained file; by default they are saved
+                as PNG files in a <name>_assets folder next to it
             
         Returns:
             str: Path to saved file
@@ -718,10 +1087,21 @@ class IntegratedWeatherDashboard:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"weather_dashboard_{city.replace(' ', '_')}_{timestamp}.html"
         
-        html_content = self.create_integrated_dashboard(city, multi_cities)
+        asset_dir = None if embed_images else f"{os.path.splitext(filename)[0]}_assets"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if compress:
+            filename += '.gz'
+            output = gzip.open(filename, 'wt', compresslevel=1, encoding='utf-8')
+        else:
+            output = open(filename, 'w', encoding='utf-8')
+        
+        # Write each chunk as it is produced rather than building the whole page first
+        try:
+            with output as f:
+                f.writelines(self.iter_integrated_dashboard(city, multi_cities, asset_dir))
+        finally:
+            # Prefetches for other cities won't be used now
+            self.discard_prefetched()
         
         print(f"✅ Dashboard saved as: {filename}")
         print(f"📊 Open the file in your web browser to view the dashboard")
@@ -736,7 +1116,7 @@ def main():
     print("=" * 50)
     
     # Get API key from environment or user input
-    api_key = os.getenv('OPENWEATHER_API_KEY')
+    api_key = api_key_from_env()
     
     if not api_key:
         print("⚠️  OpenWeatherMap API key not found in environment variables.")
@@ -750,6 +1130,10 @@ def main():
     # Initialize dashboard
     dashboard = IntegratedWeatherDashboard(api_key)
     
+    # Pay matplotlib's start-up costs while the user is typing city names
+    warm_up = threading.Thread(target=dashboard.warm_up_rendering, daemon=True)
+    warm_up.start()
+    
     # Get user input for cities
     print("\n📍 Enter the main city for detailed analysis:")
     main_city = input("Main city: ").strip()
@@ -758,6 +1142,9 @@ def main():
         print("❌ Main city is required. Exiting...")
         return
     
+    # Fetch the main city's data while the comparison cities are typed in
+    dashboard.prefetch(main_city)
+    
     print(f"\n🌍 Enter additional cities for comparison (optional):")
     print("Enter cities separated by commas, or press Enter to skip:")
     multi_cities_input = input("Additional cities: ").strip()
@@ -770,6 +1157,7 @@ def main():
     try:
         # Generate and save dashboard
         print(f"\n🔄 Generating comprehensive dashboard for {main_city}...")
+        warm_up.join()
         filename = dashboard.save_dashboard(main_city, multi_cities)
         
         print(f"\n🎉 Success! Dashboard created successfully!")
@@ -777,14 +1165,17 @@ def main():
         print(f"🌐 Open this file in your web browser to view the interactive dashboard")
         
         # Display some quick stats
-        print(f"\n📊 Dashboard includes:")
-        print("   • Current weather conditions")
-        print("   • 5-day temperature forecast")
-        print("   • Weather patterns analysis")
-        print("   • Correlation heatmaps")
-        print("   • Daily and hourly breakdowns")
+        sections = [
+            "\n📊 Dashboard includes:",
+            "   • Current weather conditions",
+            "   • 5-day temperature forecast",
+            "   • Weather patterns analysis",
+            "   • Correlation heatmaps",
+            "   • Daily and hourly breakdowns",
+        ]
         if multi_cities:
-            print("   • Multi-city comparisons")
+            sections.append("   • Multi-city comparisons")
+        print("\n".join(sections))
         
     except Exception as e:
         print(f"❌ Error creating dashboard: {e}")
@@ -796,7 +1187,7 @@ def demo_cities():
     """
     print("🚀 Running demo with predefined cities...")
     
-    api_key = os.getenv('OPENWEATHER_API_KEY')
+    api_key = api_key_from_env()
     if not api_key:
         print("❌ Please set OPENWEATHER_API_KEY environment variable for demo")
         return
@@ -816,6 +1207,27 @@ def demo_cities():
     except Exception as e:
         print(f"❌ Demo failed: {e}")
 
+
+# Rain probability descriptions, from most to least likely
+RAIN_PROBABILITY_LABELS = np.array(["High", "Medium", "Low", "Very Low"])
+
+# Clothing advice for feels-like temperatures below each breakpoint (°C),
+# with one more entry for everything above the last
+CLOTHING_BREAKPOINTS = np.array([0.0, 10.0, 20.0, 25.0])
+CLOTHING_RECOMMENDATIONS = np.array([
+    "Heavy winter coat, gloves, hat, and warm boots",
+    "Warm jacket, long pants, and closed shoes",
+    "Light jacket or sweater, long pants",
+    "T-shirt or light shirt, comfortable pants",
+    "Light clothing, shorts, and sandals",
+])
+
+# Shared lookup tables; read-only so no caller can change them for everyone
+for _table in (RAIN_PROBABILITY_LABELS, CLOTHING_BREAKPOINTS, CLOTHING_RECOMMENDATIONS):
+    _table.setflags(write=False)
+del _table
+
+
 class WeatherAnalytics:
     """
     Additional analytics utilities for weather data
@@ -834,126 +1246,192 @@ class WeatherAnalytics:
         Returns:
             float: Weather comfort score
         """
-        # Ideal conditions: 20-25°C, 40-60% humidity, 0-5 m/s wind
-        temp_score = max(0, 100 - abs(temperature - 22.5) * 4)
-        humidity_score = max(0, 100 - abs(humidity - 50) * 2)
-        wind_score = max(0, 100 - max(0, wind_speed - 5) * 10)
+        return comfort_score(temperature, humidity, wind_speed)
+    
+    @staticmethod
+    def calculate_weather_scores(temperature, humidity, wind_speed) -> np.ndarray:
+        """
+        Calculate weather comfort scores for many entries at once, e.g. a
+        whole forecast; same formula as calculate_weather_score
         
-        return (temp_score + humidity_score + wind_score) / 3
+        Args:
+            temperature (array-like): Temperatures in Celsius
+            humidity (array-like): Humidity percentages
+            wind_speed (array-like): Wind speeds in m/s
+            
+        Returns:
+            np.ndarray: Weather comfort score of each entry
+        """
+        temperature, humidity, wind_speed = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(temperature, dtype=np.float64)),
+            np.asarray(humidity, dtype=np.float64),
+            np.asarray(wind_speed, dtype=np.float64))
+        return weather_scores(np.ascontiguousarray(temperature), np.ascontiguousarray(humidity),
+                              np.ascontiguousarray(wind_speed))
     
     @staticmethod
-    def predict_rain_probability(humidity: float, pressure: float) -> str:
+    def predict_rain_probability(humidity, pressure):
         """
         Simple rain prediction based on humidity and pressure
         
         Args:
-            humidity (float): Humidity percentage
-            pressure (float): Atmospheric pressure in hPa
+            humidity (float or array-like): Humidity percentage
+            pressure (float or array-like): Atmospheric pressure in hPa
             
         Returns:
-            str: Rain probability description
+            str: Rain probability description, or an array of them when
+                given arrays (e.g. a whole forecast)
         """
-        if humidity > 80 and pressure < 1013:
-            return "High"
-        elif humidity > 60 and pressure < 1015:
-            return "Medium"
-        elif humidity > 40:
-            return "Low"
-        else:
-            return "Very Low"
+        if np.ndim(humidity) == 0 and np.ndim(pressure) == 0:
+            return RAIN_PROBABILITY_LABELS.item(rain_probability_index(humidity, pressure))
+        humidity = np.asarray(humidity)
+        pressure = np.asarray(pressure)
+        
+        # Each rule implies the one below it (High -> Medium -> Low), so
+        # counting the rules that hold gives the index into
+        # RAIN_PROBABILITY_LABELS without any branching per entry
+        bucket = (3 - (humidity > 40)
+                  - ((humidity > 60) & (pressure < 1015))
+                  - ((humidity > 80) & (pressure < 1013)))
+        return RAIN_PROBABILITY_LABELS[bucket]
     
     @staticmethod
-    def get_clothing_recommendation(temperature: float, wind_speed: float, condition: str) -> str:
+    def get_clothing_recommendation(temperature, wind_speed, condition: str = None):
         """
         Get clothing recommendations based on weather
         
         Args:
-            temperature (float): Temperature in Celsius
-            wind_speed (float): Wind speed in m/s
-            condition (str): Weather condition
+            temperature (float or array-like): Temperature in Celsius
+            wind_speed (float or array-like): Wind speed in m/s
+            condition (str): Weather condition (not used yet)
             
         Returns:
-            str: Clothing recommendation
+            str: Clothing recommendation, or an array of them when given
+                arrays (e.g. a whole forecast)
         """
+        if np.ndim(temperature) == 0 and np.ndim(wind_speed) == 0:
+            return CLOTHING_RECOMMENDATIONS.item(clothing_index(temperature, wind_speed))
+        
         # Calculate feels-like temperature with wind chill
-        feels_like = temperature - (wind_speed * 2)
-        
-        if feels_like < 0:
-            return "Heavy winter coat, gloves, hat, and warm boots"
-        elif feels_like < 10:
-            return "Warm jacket, long pants, and closed shoes"
-        elif feels_like < 20:
-            return "Light jacket or sweater, long pants"
-        elif feels_like < 25:
-            return "T-shirt or light shirt, comfortable pants"
-        else:
-            return "Light clothing, shorts, and sandals"
+        feels_like = np.asarray(temperature) - np.asarray(wind_speed) * 2
+        
+        # side='right' puts a value equal to a breakpoint in the warmer band,
+        # matching the strict "<" comparisons
+        return CLOTHING_RECOMMENDATIONS[np.searchsorted(CLOTHING_BREAKPOINTS, feels_like, side='right')]
+    
+    @staticmethod
+    def analyze_forecast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score every forecast entry and attach rain and clothing advice; same
+        rules as the per-entry helpers, computed in a single kernel pass
+        
+        Args:
+            df (pd.DataFrame): Forecast data from process_forecast_data
+        
+        Returns:
+            pd.DataFrame: weather_score, rain_probability and clothing
+                columns, indexed like df
+        """
+        scores, rain_ids, clothing_ids = forecast_analytics(
+            *(np.ascontiguousarray(df[column], dtype=np.float64)
+              for column in ('temperature', 'humidity', 'wind_speed', 'pressure')))
+        return pd.DataFrame({
+            'weather_score': scores,
+            'rain_probability': RAIN_PROBABILITY_LABELS[rain_ids],
+            'clothing': CLOTHING_RECOMMENDATIONS[clothing_ids],
+        }, index=df.index)
+
+
+# Contents of the sample configuration file
+DEFAULT_CONFIG = {
+    "default_cities": ["London", "New York", "Tokyo", "Sydney"],
+    "api_settings": {
+        "timeout": 30,
+        "units": "metric",
+        "retries": 3
+    },
+    "dashboard_settings": {
+        "theme": "modern",
+        "chart_colors": ["#2E86AB", "#A23B72", "#F18F01", "#C73E1D"],
+        "auto_refresh": False,
+        "include_analytics": True
+    },
+    "output_settings": {
+        "save_data": True,
+        "export_csv": False,
+        "include_timestamp": True
+    }
+}
+
+# The sample config never changes, so it is serialized once at import.
+# Written with json for its 4-space indent; orjson can only indent by two
+DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG, indent=4).encode()
+
 
 def create_config_file():
     """
     Create a sample configuration file for the dashboard
     """
-    config = {
-        "default_cities": ["London", "New York", "Tokyo", "Sydney"],
-        "api_settings": {
-            "timeout": 30,
-            "units": "metric",
-            "retries": 3
-        },
-        "dashboard_settings": {
-            "theme": "modern",
-            "chart_colors": ["#2E86AB", "#A23B72", "#F18F01", "#C73E1D"],
-            "auto_refresh": False,
-            "include_analytics": True
-        },
-        "output_settings": {
-            "save_data": True,
-            "export_csv": False,
-            "include_timestamp": True
-        }
-    }
+    with open('weather_config.json', 'wb') as f:
+        f.write(DEFAULT_CONFIG_JSON)
     
-    with open('weather_config.json', 'w') as f:
-        json.dump(config, indent=4, fp=f)
+    # The next load_config() call should see the new file
+    load_config.cache_clear()
     
     print("✅ Configuration file created: weather_config.json")
 
+@functools.lru_cache(maxsize=1)
 def load_config():
     """
-    Load configuration from file
+    Load configuration from file, reading it only once per session
     
     Returns:
-        dict: Configuration dictionary
+        dict: Configuration dictionary, shared between callers; don't modify it
     """
     try:
-        with open('weather_config.json', 'r') as f:
-            return json.load(f)
+        with open('weather_config.json', 'rb') as f:
+            content = f.read()
     except FileNotFoundError:
         print("⚠️  Configuration file not found, using defaults")
         return {}
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+# Start-up menu, joined once so it is written in a single call
+MENU_TEXT = "\n".join([
+    "🌤️  Integrated Weather Dashboard System",
+    "=" * 60,
+    "Choose an option:",
+    "1. Create custom dashboard",
+    "2. Run demo with sample cities",
+    "3. Create configuration file",
+    "4. Exit",
+])
+
+
+def say_goodbye():
+    """Leave without doing anything"""
+    print("👋 Goodbye!")
+
+
+def run_invalid_choice():
+    """Fall back to the custom dashboard for unrecognized menu input"""
+    print("❌ Invalid choice. Running main function...")
+    main()
+
+
+# Menu choice -> action; new options only need an entry here and in MENU_TEXT
+MENU_ACTIONS = {
+    "1": main,
+    "2": demo_cities,
+    "3": create_config_file,
+    "4": say_goodbye,
+}
 
-# Import numpy for correlation calculations
-import numpy as np
 
 if __name__ == "__main__":
-    print("🌤️  Integrated Weather Dashboard System")
-    print("=" * 60)
-    print("Choose an option:")
-    print("1. Create custom dashboard")
-    print("2. Run demo with sample cities")
-    print("3. Create configuration file")
-    print("4. Exit")
+    print(MENU_TEXT)
     
     choice = input("\nEnter your choice (1-4): ").strip()
     
-    if choice == "1":
-        main()
-    elif choice == "2":
-        demo_cities()
-    elif choice == "3":
-        create_config_file()
-    elif choice == "4":
-        print("👋 Goodbye!")
-    else:
-        print("❌ Invalid choice. Running main function...")
-        main()
\ No newline at end of file
+    MENU_ACTIONS.get(choice, run_invalid_choice)()
\ No newline at end of file
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels for the web dashboard and its weather analytics
+Each kernel has an explicit signature, so Numba compiles it (or loads it
+from cache) when this module is imported rather than on the first
+dashboard; callers pass C-contiguous float64 arrays. Kept apart from
+weather_kernels so the GUI doesn't pay for kernels it never uses
+"""
+
+import numpy as np
+
+# weather_kernels sets up the Numba cache directory and the plain-Python
+# fallback when Numba isn't installed
+from weather_kernels import njit
+
+
+@njit('float64[:, ::1](float64[:, ::1])', cache=True, error_model='numpy')
+def correlation_matrix(values):
+    """
+    Compute the Pearson correlation matrix of the columns of a 2-D array
+    
+    Args:
+        values (np.ndarray): Float values, one row per entry and one column per variable
+        
+    Returns:
+        np.ndarray: Square matrix of correlation coefficients between columns
+    """
+    n_rows, n_cols = values.shape
+    means = np.zeros(n_cols)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            means[j] += values[i, j]
+    means /= n_rows
+    
+    # Sums of centered cross products; only the upper triangle is filled
+    sums = np.zeros((n_cols, n_cols))
+    for i in range(n_rows):
+        for j in range(n_cols):
+            centered = values[i, j] - means[j]
+            for k in range(j, n_cols):
+                sums[j, k] += centered * (values[i, k] - means[k])
+    
+    result = np.empty((n_cols, n_cols))
+    for j in range(n_cols):
+        for k in range(j, n_cols):
+            result[j, k] = sums[j, k] / np.sqrt(sums[j, j] * sums[k, k])
+            result[k, j] = result[j, k]
+    return result
+
+
+@njit('float64(float64, float64, float64)', cache=True)
+def comfort_score(temperature, humidity, wind_speed):
+    """
+    Compute the 0-100 weather comfort score of a single entry
+    
+    Args:
+        temperature (float): Temperature in Celsius
+        humidity (float): Humidity percentage
+        wind_speed (float): Wind speed in m/s
+        
+    Returns:
+        float: Comfort score
+    """
+    # Ideal conditions: 20-25°C, 40-60% humidity, 0-5 m/s wind
+    temp_score = max(0.0, 100.0 - abs(temperature - 22.5) * 4.0)
+    humidity_score = max(0.0, 100.0 - abs(humidity - 50.0) * 2.0)
+    wind_score = max(0.0, 100.0 - max(0.0, wind_speed - 5.0) * 10.0)
+    return (temp_score + humidity_score + wind_score) / 3.0
+
+
+@njit('int64(float64, float64)', cache=True)
+def rain_probability_index(humidity, pressure):
+    """
+    Classify the chance of rain of a single entry
+    
+    Args:
+        humidity (float): Humidity percentage
+        pressure (float): Atmospheric pressure in hPa
+        
+    Returns:
+        int: 0 (High) to 3 (Very Low), indexing RAIN_PROBABILITY_LABELS
+    """
+    if humidity > 80 and pressure < 1013:
+        return 0
+    if humidity > 60 and pressure < 1015:
+        return 1
+    if humidity > 40:
+        return 2
+    return 3
+
+
+@njit('int64(float64, float64)', cache=True)
+def clothing_index(temperature, wind_speed):
+    """
+    Pick the clothing band of a single entry from its feels-like temperature
+    
+    Args:
+        temperature (float): Temperature in Celsius
+        wind_speed (float): Wind speed in m/s
+        
+    Returns:
+        int: 0 (coldest) to 4 (warmest), indexing CLOTHING_RECOMMENDATIONS
+    """
+    # Feels-like temperature with wind chill
+    feels_like = temperature - wind_speed * 2.0
+    if feels_like < 0:
+        return 0
+    if feels_like < 10:
+        return 1
+    if feels_like < 20:
+        return 2
+    if feels_like < 25:
+        return 3
+    return 4
+
+
+@njit('float64[::1](float64[::1], float64[::1], float64[::1])', cache=True)
+def weather_scores(temperatures, humidities, wind_speeds):
+    """
+    Compute the 0-100 weather comfort score for every entry in one pass
+    
+    Args:
+        temperatures (np.ndarray): Temperatures in Celsius
+        humidities (np.ndarray): Humidity percentages
+        wind_speeds (np.ndarray): Wind speeds in m/s
+        
+    Returns:
+        np.ndarray: Comfort score of each entry
+    """
+    scores = np.empty(temperatures.shape[0])
+    for i in range(temperatures.shape[0]):
+        scores[i] = comfort_score(temperatures[i], humidities[i], wind_speeds[i])
+    return scores
+
+
+@njit('Tuple((float64[::1], int8[::1], int8[::1]))(float64[::1], float64[::1], float64[::1], float64[::1])',
+      cache=True)
+def forecast_analytics(temperatures, humidities, wind_speeds, pressures):
+    """
+    Compute comfort score, rain probability and clothing advice for every
+    entry in one pass
+    
+    Args:
+        temperatures (np.ndarray): Temperatures in Celsius
+        humidities (np.ndarray): Humidity percentages
+        wind_speeds (np.ndarray): Wind speeds in m/s
+        pressures (np.ndarray): Atmospheric pressures in hPa
+        
+    Returns:
+        tuple: (scores, rain_ids, clothing_ids); the ids index
+            RAIN_PROBABILITY_LABELS and CLOTHING_RECOMMENDATIONS
+    """
+    n = temperatures.shape[0]
+    scores = np.empty(n)
+    rain_ids = np.empty(n, dtype=np.int8)
+    clothing_ids = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        scores[i] = comfort_score(temperatures[i], humidities[i], wind_speeds[i])
+        rain_ids[i] = rain_probability_index(humidities[i], pressures[i])
+        clothing_ids[i] = clothing_index(temperatures[i], wind_speeds[i])
+    return scores, rain_ids, clothing_ids
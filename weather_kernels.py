@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels for weather data aggregation
+Compiled to native code with Numba when it is installed
+"""
+
+import os
+
+import numpy as np
+
+# Keep compiled kernels in a per-user cache so they are built once per
+# machine, even when the project directory is read-only
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'weather_dashboard_numba'))
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def daily_stats(values, bucket_ids, n_days):
+    """
+    Compute per-day min, max and mean of a forecast variable in one pass
+    
+    Args:
+        values (np.ndarray): Float values, one per forecast entry
+        bucket_ids (np.ndarray): Integer day index (0..n_days-1) of each entry
+        n_days (int): Number of distinct days
+        
+    Returns:
+        tuple: (mins, maxs, means) arrays of length n_days
+    """
+    mins = np.full(n_days, np.inf)
+    maxs = np.full(n_days, -np.inf)
+    sums = np.zeros(n_days)
+    counts = np.zeros(n_days, dtype=np.int64)
+    
+    for i in range(values.shape[0]):
+        day = bucket_ids[i]
+        value = values[i]
+        if value < mins[day]:
+            mins[day] = value
+        if value > maxs[day]:
+            maxs[day] = value
+        sums[day] += value
+        counts[day] += 1
+    
+    return mins, maxs, sums / counts